@@ -9,6 +9,12 @@ from typing import Dict, Any, Optional
 
 from .logger import get_logger
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ConfigManager:
     """Singleton configuration manager with caching and file monitoring"""
@@ -34,8 +40,9 @@ class ConfigManager:
             if (config_path not in self._last_modified or 
                 self._last_modified[config_path] < current_mtime):
                 
-                with open(config_path, "r") as f:
-                    self._configs[config_path] = json.load(f)
+                with open(config_path, "rb") as f:
+                    raw = f.read()
+                self._configs[config_path] = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
                 self._last_modified[config_path] = current_mtime
                 self.logger.debug(f"Loaded config: {config_path}")
                 
@@ -46,6 +53,13 @@ class ConfigManager:
     
     def save_config(self, config_path: str, config_data: Dict[str, Any]) -> bool:
         """Save configuration to file"""
+        if not self.write_config_file(config_path, config_data):
+            return False
+        self.update_cache(config_path, config_data)
+        return True
+    
+    def write_config_file(self, config_path: str, config_data: Dict[str, Any]) -> bool:
+        """Write configuration to file without touching the cache (safe off the GUI thread)"""
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(config_path), exist_ok=True)
@@ -53,11 +67,6 @@ class ConfigManager:
             with open(config_path, "w") as f:
                 json.dump(config_data, f, indent=2)
             
-            # Update cache
-            self._configs[config_path] = config_data
-            self._last_modified[config_path] = os.path.getmtime(config_path)
-            self.clear_cache()
-            
             self.logger.info(f"Saved config: {config_path}")
             return True
             
@@ -65,6 +74,12 @@ class ConfigManager:
             self.logger.error(f"Failed to save config {config_path}: {e}")
             return False
     
+    def update_cache(self, config_path: str, config_data: Dict[str, Any]):
+        """Refresh the cache after a write; call from the GUI thread"""
+        self._configs[config_path] = config_data
+        self._last_modified[config_path] = os.path.getmtime(config_path)
+        self.clear_cache()
+    
     def get_wave_config(self) -> Dict[str, Any]:
         """Get wave detection configuration with defaults"""
         config = self.get_config("resources/configs/steamdeck_config.json")
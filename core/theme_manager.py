@@ -2,11 +2,23 @@
 
 import os
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Any, List
 from .logger import get_logger
 
 
+@dataclass(frozen=True, slots=True)
+class ThemeSnapshot:
+    """The colors styling code reads most, captured once per theme"""
+    primary: str
+    primary_light: str
+    primary_gradient: str
+    panel_bg: str
+    green: str
+    red: str
+
+
 class ThemeManager:
     """Manages application themes with dynamic switching capability"""
     
@@ -89,6 +101,7 @@ class ThemeManager:
     }
 
     _current_theme: Dict[str, Any] = THEMES["Wall-e"]
+    _snapshots: Dict[str, ThemeSnapshot] = {}
     _callbacks: List[Callable[[], None]] = []
     _logger = None
     _config_path = "resources/configs/theme_config.json"
@@ -140,6 +153,24 @@ class ThemeManager:
         """Get theme property value"""
         return cls._current_theme.get(key, default)
 
+    @classmethod
+    def snapshot(cls) -> ThemeSnapshot:
+        """Get the current theme's common colors as one immutable object"""
+        name = cls._current_theme["name"]
+        snap = cls._snapshots.get(name)
+        if snap is None:
+            theme = cls._current_theme
+            snap = ThemeSnapshot(
+                primary=theme["primary_color"],
+                primary_light=theme["primary_light"],
+                primary_gradient=theme["primary_gradient"],
+                panel_bg=theme["panel_bg"],
+                green=theme["green"],
+                red=theme["red"]
+            )
+            cls._snapshots[name] = snap
+        return snap
+
     @classmethod
     def get_icon_path(cls, icon_name: str, pressed: bool = False) -> str:
         """Get path to themed icon"""
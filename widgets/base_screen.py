@@ -45,6 +45,15 @@ class BaseScreen(QWidget, ABC, metaclass=WidgetABCMeta):
         else:
             self.logger.warning(f"Cannot send {message_type}: WebSocket not connected")
             return False
+    
+    @error_boundary
+    def send_websocket_text(self, text: str) -> bool:
+        """Send an already serialized JSON message via WebSocket if available"""
+        if self.websocket and self.websocket.is_connected():
+            return self.websocket.send_safe(text)
+        else:
+            self.logger.warning(f"Cannot send {text}: WebSocket not connected")
+            return False
 
 from PyQt6.QtGui import QPainter, QColor, QFont
 from PyQt6.QtCore import QRect
@@ -1,17 +1,29 @@
 import json
+from bisect import bisect_left
+from itertools import islice
+from types import MappingProxyType
+from PyQt6 import sip
 from PyQt6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton,
     QScrollArea, QWidget, QCheckBox, QComboBox, QMessageBox,
     QLineEdit, QDoubleSpinBox, QSpinBox, QListWidget, QListWidgetItem,
     QHeaderView, QTableWidget, QTableWidgetItem, QFrame, QDialog,
-    QDialogButtonBox
+    QDialogButtonBox, QApplication
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QEasingCurve, QRect, QParallelAnimationGroup, QTimer
-from PyQt6.QtGui import QFont, QPainter, QPalette
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QRect, QTimer,
+    QObject, QRunnable, QThreadPool, QSignalBlocker, QStringListModel
+)
+from PyQt6.QtGui import QFont, QPainter, QPalette, QPixmap, QPixmapCache, QColor, QPen, QIntValidator
 from widgets.base_screen import BaseScreen
 from core.config_manager import config_manager
 from core.theme_manager import theme_manager  # Import theme manager
 from core.utils import error_boundary
+from widgets.screen_helpers import get_font, json_dumps, json_loads, load_qss_template
+
+# Static requests are serialized once and sent as-is
+GET_SCENES_MESSAGE = json.dumps({"type": "get_scenes"})
+GET_AUDIO_FILES_MESSAGE = json.dumps({"type": "get_audio_files"})
 
 # Category definitions with emojis
 CATEGORIES = {
@@ -28,28 +40,164 @@ CATEGORIES = {
     "Sleepy": "😴"
 }
 
+# Precomputed once so rows and the selector dialog don't rebuild them
+CATEGORY_KEYS = tuple(CATEGORIES)
+CATEGORY_LABELS = {category: f"{emoji} {category}" for category, emoji in CATEGORIES.items()}
+
 SCENE_TYPE_SYMBOLS = {
     "Audio": "🎵",
     "Script": "🎬"
 }
 
+# Stylesheets are templates in resources/styles: each file is read once and
+# filled with theme colors once per theme. Widgets opt in via objectName and
+# switch state through dynamic properties rather than new stylesheets.
+SCENE_ROWS_QSS_PATH = "resources/styles/scene_rows.qss"
+SCENE_CONTROLS_QSS_PATH = "resources/styles/scene_controls.qss"
+THEMED_QSS = {}
+
+
+def get_themed_qss(path):
+    """Return the stylesheet at path filled in for the current theme"""
+    key = (theme_manager.get_theme_name(), path)
+    qss = THEMED_QSS.get(key)
+    if qss is None:
+        qss = load_qss_template(path).substitute(theme_qss_colors())
+        THEMED_QSS[key] = qss
+    return qss
+
+
+def get_scene_rows_qss():
+    """Return the shared scene row stylesheet for the current theme"""
+    return get_themed_qss(SCENE_ROWS_QSS_PATH)
+
+
+def theme_qss_colors():
+    """Collect the theme colors the stylesheet templates refer to"""
+    green = theme_manager.get("green")
+    return {
+        "card_bg": theme_manager.get("card_bg"),
+        "primary": theme_manager.get("primary_color"),
+        "primary_light": theme_manager.get("primary_light"),
+        "grey": theme_manager.get("grey"),
+        "green": green,
+        "green_gradient": theme_manager.get("green_gradient", f"qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {green}, stop:1 #2d8f2d)"),
+        "red": theme_manager.get("red"),
+        "expanded_bg": theme_manager.get("expanded_bg"),
+    }
+
+
+def repolish(widget):
+    """Re-apply stylesheet rules after a dynamic property change"""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+def indicator_pixmap(text, color):
+    """Render an audio/script indicator label once per text and color"""
+    key = f"sceneindicator:{text}:{color}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap(90, 25)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(get_font(11, QFont.Weight.Bold))
+        painter.setPen(QColor(color))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class MessageParseSignals(QObject):
+    """Signals used to hand decoded messages back to the GUI thread"""
+    parsed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class MessageParseTask(QRunnable):
+    """Decode a WebSocket text frame off the GUI thread"""
+    
+    def __init__(self, message, signals):
+        super().__init__()
+        self.message = message
+        self.signals = signals
+    
+    def run(self):
+        try:
+            msg = json_loads(self.message)
+        except ValueError as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.parsed.emit(msg)
+
+
+class ConfigSaveSignals(QObject):
+    """Signals used to report a background config save to the GUI thread"""
+    finished = pyqtSignal(bool, object)
+
+
+class ConfigSaveTask(QRunnable):
+    """Write a config file off the GUI thread; the cache is refreshed by the finished slot"""
+    
+    def __init__(self, config_path, config_data, signals):
+        super().__init__()
+        self.config_path = config_path
+        self.config_data = config_data
+        self.signals = signals
+    
+    def run(self):
+        success = config_manager.write_config_file(self.config_path, self.config_data)
+        self.signals.finished.emit(success, self.config_data)
+
+
+class ClickableWidget(QWidget):
+    """QWidget that emits clicked on mouse press"""
+    
+    clicked = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Subclasses only paint stylesheet backgrounds when asked to
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+        event.accept()
+
+
+class ClickableLabel(QLabel):
+    """QLabel that emits clicked on mouse press"""
+    
+    clicked = pyqtSignal()
+    
+    def mousePressEvent(self, event):
+        self.clicked.emit()
+        event.accept()
+
+
 class TouchFriendlyMultiSelect(QWidget):
     """Touch-friendly multi-select widget with modal dialog"""
     
+    categories_changed = pyqtSignal(list)
+    
     def __init__(self, categories, selected_categories=None):
         super().__init__()
         self.categories = categories
         self.selected_categories = selected_categories or []
+        self.selector_dialog = None  # Built on first open, then reused
         self.setup_ui()
     
     def setup_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         
-        self.display_label = QLabel(self.get_display_text())
+        self.display_label = ClickableLabel(self.get_display_text())
         self.update_style()
         self.display_label.setMinimumHeight(45)
-        self.display_label.mousePressEvent = self.open_selector
+        self.display_label.clicked.connect(self.open_selector)
         
         layout.addWidget(self.display_label)
     
@@ -59,6 +207,11 @@ class TouchFriendlyMultiSelect(QWidget):
         primary_light = theme_manager.get("primary_light")
         card_bg = theme_manager.get("card_bg")
         
+        # The cached dialog carries the old theme colors, so rebuild it on next open
+        if self.selector_dialog is not None:
+            self.selector_dialog.deleteLater()
+            self.selector_dialog = None
+        
         self.display_label.setStyleSheet(f"""
             QLabel {{
                 background-color: {card_bg};
@@ -84,11 +237,17 @@ class TouchFriendlyMultiSelect(QWidget):
         else:
             return f"{len(self.selected_categories)} categories selected"
     
-    def open_selector(self, event):
-        dialog = CategorySelectorDialog(self.categories, self.selected_categories, self)
+    def open_selector(self):
+        dialog = self.selector_dialog
+        if dialog is None:
+            dialog = CategorySelectorDialog(self.categories, self.selected_categories, self)
+            self.selector_dialog = dialog
+        else:
+            dialog.set_selected_categories(self.selected_categories)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.selected_categories = dialog.get_selected_categories()
             self.display_label.setText(self.get_display_text())
+            self.categories_changed.emit(self.selected_categories.copy())
     
     def get_selected_categories(self):
         return self.selected_categories.copy()
@@ -103,7 +262,7 @@ class CategorySelectorDialog(QDialog):
     def __init__(self, categories, selected_categories, parent=None):
         super().__init__(parent)
         self.categories = categories
-        self.selected_categories = selected_categories.copy()
+        self.selected_categories = set(selected_categories)
         self.checkboxes = {}
         self.setup_ui()
         
@@ -126,7 +285,7 @@ class CategorySelectorDialog(QDialog):
         
         # Header
         header = QLabel("Select Categories:")
-        header.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        header.setFont(get_font(18, QFont.Weight.Bold))
         header.setStyleSheet(f"color: {primary}; padding: 15px;")
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(header)
@@ -146,38 +305,38 @@ class CategorySelectorDialog(QDialog):
         scroll_widget = QWidget()
         scroll_layout = QVBoxLayout(scroll_widget)
         scroll_layout.setSpacing(5)
+        # One sheet for all category checkboxes rather than one per checkbox
+        scroll_widget.setStyleSheet(f"""
+            QCheckBox {{
+                color: {primary};
+                font-size: 16px;
+                padding: 12px;
+                min-height: 40px;
+                font-weight: 500;
+            }}
+            QCheckBox::indicator {{
+                width: 24px;
+                height: 24px;
+            }}
+            QCheckBox::indicator:checked {{
+                background-color: {primary};
+                border: 2px solid {primary};
+                border-radius: 4px;
+            }}
+            QCheckBox::indicator:unchecked {{
+                background-color: #555;
+                border: 2px solid {grey};
+                border-radius: 4px;
+            }}
+            QCheckBox:hover {{
+                background-color: #3a3a3a;
+            }}
+        """)
         
         # Create checkboxes for each category
         for category in self.categories:
-            emoji = CATEGORIES.get(category, "⭐")
-            checkbox = QCheckBox(f"{emoji} {category}")
+            checkbox = QCheckBox(CATEGORY_LABELS.get(category) or f"⭐ {category}")
             checkbox.setChecked(category in self.selected_categories)
-            checkbox.setStyleSheet(f"""
-                QCheckBox {{
-                    color: {primary};
-                    font-size: 16px;
-                    padding: 12px;
-                    min-height: 40px;
-                    font-weight: 500;
-                }}
-                QCheckBox::indicator {{
-                    width: 24px;
-                    height: 24px;
-                }}
-                QCheckBox::indicator:checked {{
-                    background-color: {primary};
-                    border: 2px solid {primary};
-                    border-radius: 4px;
-                }}
-                QCheckBox::indicator:unchecked {{
-                    background-color: #555;
-                    border: 2px solid {grey};
-                    border-radius: 4px;
-                }}
-                QCheckBox:hover {{
-                    background-color: #3a3a3a;
-                }}
-            """)
             self.checkboxes[category] = checkbox
             scroll_layout.addWidget(checkbox)
         
@@ -211,170 +370,160 @@ class CategorySelectorDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
     
-    def get_selected_categories(self):
-        selected = []
+    def set_selected_categories(self, selected_categories):
+        """Reset the checkboxes before the dialog is shown again"""
+        self.selected_categories = set(selected_categories)
         for category, checkbox in self.checkboxes.items():
-            if checkbox.isChecked():
-                selected.append(category)
-        return selected
+            checkbox.setChecked(category in self.selected_categories)
+    
+    def get_selected_categories(self):
+        return [category for category, checkbox in self.checkboxes.items() if checkbox.isChecked()]
     
 class EnhancedSceneRow(QWidget):
     """Enhanced expandable scene row with better styling and layout"""
     
-    def __init__(self, scene_data, audio_files, row_index, parent_screen):
+    COLLAPSED_HEIGHT = 70
+    
+    def __init__(self, scene_data, audio_model, row_index, parent_screen, materialize=True):
         super().__init__()
-        self.scene_data = scene_data
-        self.audio_files = audio_files
-        self.row_index = row_index
+        # Private copy kept in step with the widgets, so reads never touch Qt
+        self.scene_data = dict(scene_data)
+        self.audio_model = audio_model  # Shared by every row's audio combo
         self.parent_screen = parent_screen
         self.is_expanded = False
+        self.is_materialized = False
         self.details_widget = None
-        self.animation_group = None
-        self.setup_ui()
         
-        # Register for theme changes
-        theme_manager.register_callback(self.update_theme)
-    
-    def setup_ui(self):
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
         
-        # Create main row (always visible)
-        self.create_main_row()
-        
-        # Create details row (expandable)
-        self.create_details_row()
+        # Off-screen rows stay as fixed-height placeholders until scrolled into view
+        self.setMinimumHeight(self.COLLAPSED_HEIGHT)
+        if materialize:
+            self.materialize()
         
-        # Initially hide details
-        self.details_widget.hide()
+        # Register for theme changes
+        theme_manager.register_callback(self.update_theme)
     
-    def update_theme(self):
-        """Update styling when theme changes"""
-        self.update_main_row_style()
-        self.update_details_style()
-        self.update_name_edit_style()
-        self.update_button_theme_colors()
-        self.update_expand_indicator_style()  
-        if hasattr(self, 'category_selector'):
-            self.category_selector.update_style()
+    def release(self):
+        """Detach the row and schedule its deletion"""
+        theme_manager.unregister_callback(self.update_theme)
+        self.setParent(None)
+        self.deleteLater()
     
-    def update_main_row_style(self):
-        """Update main row styling"""
-        card_bg = theme_manager.get("card_bg")
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        grey = theme_manager.get("grey")
+    def load_scene(self, scene_data):
+        """Show a different scene in this row, reusing whatever widgets it already has"""
+        self.scene_data = dict(scene_data)
+        if not self.is_materialized:
+            self.update()  # Repaint the placeholder header
+            return
         
-        if self.is_expanded:
-            self.main_row.setStyleSheet(f"""
-                QWidget {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {card_bg}, stop:1 #1f1f1f);
-                    border: 2px solid {primary};
-                    border-bottom: 1px solid {grey};
-                    border-radius: 8px 8px 0px 0px;
-                    margin: 2px;
-                    margin-bottom: 0px;
-                }}
-            """)
+        with QSignalBlocker(self.name_edit):
+            self.name_edit.setText(self.scene_data.get("label", ""))
+        self.category_selector.set_selected_categories(self.scene_data.get("categories", []))
+        if self.details_widget is not None:
+            self.set_detail_values()
         else:
-            self.main_row.setStyleSheet(f"""
-                QWidget {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {card_bg}, stop:1 #1f1f1f);
-                    border: 2px solid {grey};
-                    border-radius: 8px;
-                    margin: 2px;
-                }}
-                QWidget:hover {{
-                    border: 2px solid {primary};
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #2a2a2a, stop:1 #232323);
-                }}
-            """)
+            self.update_indicators()
     
-    def update_name_edit_style(self):
-        """Update name edit field styling"""
-        card_bg = theme_manager.get("card_bg")
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        
-        self.name_edit.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {card_bg};
-                border: 2px solid {primary};
-                border-radius: 6px;
-                color: {primary};
-                padding: 5px 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }}
-            QLineEdit:focus {{
-                border-color: {primary_light};
-                background-color: #2a2a2a;
-            }}
-        """)
+    def materialize(self):
+        """Build the row widgets (no-op if already built)"""
+        if self.is_materialized:
+            return
+        self.is_materialized = True
+        self.setup_ui()
     
-    def update_button_theme_colors(self):
-        """Update Audio and Script button colors based on theme"""
-        primary = theme_manager.get("primary_color")
-        grey = theme_manager.get("grey")
-        
-        audio_enabled = self.audio_cb.isChecked() if hasattr(self, 'audio_cb') else self.scene_data.get("audio_enabled", False)
-        script_enabled = self.script_cb.isChecked() if hasattr(self, 'script_cb') else self.scene_data.get("script_enabled", False)
-        
-        # Update audio indicator
-        self.audio_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid {'#666' if not audio_enabled else primary};
-                background: {primary if audio_enabled else 'transparent'};
-                color: {'white' if audio_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
-        
-        # Update script indicator  
-        self.script_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid {'#666' if not script_enabled else primary};
-                background: {primary if script_enabled else 'transparent'};
-                color: {'white' if script_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+    def dematerialize(self):
+        """Fold the row back into a painted placeholder, keeping any edits"""
+        if not self.is_materialized or self.is_expanded:
+            return False
+        focus = QApplication.focusWidget()
+        if focus is not None and self.isAncestorOf(focus):
+            return False
+        
+        # scene_data already holds every edit, so the widgets can simply go
+        for widget in (self.main_row, self.details_widget):
+            if widget is not None:
+                widget.setParent(None)
+                widget.deleteLater()
+        self.details_widget = None
+        self.is_materialized = False
+        self.update()
+        return True
+    
+    def paintEvent(self, event):
+        """Paint a cached header preview while the row is still a placeholder"""
+        if self.is_materialized:
+            super().paintEvent(event)
+            return
         
-    def update_expand_indicator_style(self):
-        """Update expand indicator color based on theme"""
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
+        label = self.scene_data.get("label", "")
+        audio_enabled = self.scene_data.get("audio_enabled", False)
+        script_enabled = self.scene_data.get("script_enabled", False)
+        key = (f"scenerow:{theme_manager.get_theme_name()}:{self.width()}:"
+               f"{label}:{audio_enabled}:{script_enabled}")
+        
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(self.width(), self.COLLAPSED_HEIGHT)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            self.paint_placeholder_header(painter, label, audio_enabled, script_enabled)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.end()
+    
+    def paint_placeholder_header(self, painter, label, audio_enabled, script_enabled):
+        """Draw an approximation of the collapsed main row"""
+        primary = QColor(theme_manager.get("primary_color"))
+        grey = QColor(theme_manager.get("grey"))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        painter.setPen(QPen(grey, 2))
+        painter.setBrush(QColor(theme_manager.get("card_bg")))
+        painter.drawRoundedRect(QRect(3, 3, self.width() - 6, self.COLLAPSED_HEIGHT - 6), 8, 8)
+        
+        painter.setFont(get_font(12, QFont.Weight.Bold))
+        painter.setPen(primary)
+        center = Qt.AlignmentFlag.AlignCenter
+        painter.drawText(QRect(12, 15, 40, 40), center, "▶")
+        painter.drawText(QRect(80, 15, 200, 40), Qt.AlignmentFlag.AlignVCenter, label)
+        
+        painter.setPen(primary if audio_enabled else grey)
+        painter.drawText(QRect(530, 18, 100, 35), center, "🎵 Audio" if audio_enabled else "Audio")
+        painter.setPen(primary if script_enabled else grey)
+        painter.drawText(QRect(638, 18, 100, 35), center, "🎬 Script" if script_enabled else "Script")
+    
+    def setup_ui(self):
+        # Assemble children without repainting the row after each one
+        self.setUpdatesEnabled(False)
+        try:
+            # Create main row (always visible)
+            self.create_main_row()
+        finally:
+            self.setUpdatesEnabled(True)
         
-        if self.is_expanded:
-            color = primary_light
-        else:
-            color = primary
-            
-        self.expand_indicator.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-weight: bold;
-                font-size: 18px;
-                border: none;
-                background: transparent;
-            }}
-        """)
-
+        # Details row is built on first expand; most rows are never opened
+    
+    def update_theme(self):
+        """Update styling when theme changes (row rules come from the scenes container)"""
+        if not self.is_materialized:
+            return
+        self.category_selector.update_style()
+        self.update_indicators()
+    
     def create_main_row(self):
-        self.main_row = QWidget()
+        self.main_row = ClickableWidget()
+        self.main_row.setObjectName("sceneMainRow")
+        self.main_row.setProperty("expanded", False)
         self.main_row.setFixedHeight(70)
-        self.update_main_row_style()
         
         # Make the main row clickable
-        self.main_row.mousePressEvent = self.toggle_expansion
+        self.main_row.clicked.connect(self.toggle_expansion)
         
         layout = QHBoxLayout(self.main_row)
         layout.setContentsMargins(10, 15, 10, 15)
@@ -382,76 +531,51 @@ class EnhancedSceneRow(QWidget):
         
         # Expand/collapse indicator
         self.expand_indicator = QLabel("▶")
-        primary = theme_manager.get("primary_color")
-        self.expand_indicator.setStyleSheet(f"""
-            QLabel {{
-                color: {primary};
-                font-weight: bold;
-                font-size: 18px;
-                border: none;
-                background: transparent;
-            }}
-        """)
+        self.expand_indicator.setObjectName("expandIndicator")
+        self.expand_indicator.setProperty("expanded", False)
         self.expand_indicator.setFixedSize(40, 40)
         self.expand_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.expand_indicator)
         
         # Name field
         self.name_edit = QLineEdit(self.scene_data.get("label", ""))
-        self.update_name_edit_style()
+        self.name_edit.setObjectName("sceneNameEdit")
         self.name_edit.setMaxLength(32)
         self.name_edit.setFixedSize(220, 45)
+        self.name_edit.textChanged.connect(lambda text: self.update_state("label", text))
         layout.addWidget(self.name_edit)
         
         # Categories multi-select
-        categories = list(CATEGORIES.keys())
         selected_categories = self.scene_data.get("categories", [])
-        self.category_selector = TouchFriendlyMultiSelect(categories, selected_categories)
+        self.category_selector = TouchFriendlyMultiSelect(CATEGORY_KEYS, selected_categories)
         self.category_selector.setFixedSize(220, 45)
+        self.category_selector.categories_changed.connect(
+            lambda categories: self.update_state("categories", categories)
+        )
         layout.addWidget(self.category_selector)
         
         # Type indicators
         type_widget = QWidget()
         type_widget.setFixedSize(220, 45)
-        type_widget.setStyleSheet("QWidget { border: none; }")
+        type_widget.setObjectName("sceneTypeBox")
         type_layout = QHBoxLayout(type_widget)
         type_layout.setContentsMargins(0, 0, 0, 0)
         type_layout.setSpacing(8)
 
         # Audio indicator
-        audio_enabled = self.scene_data.get("audio_enabled", False)
-        self.audio_indicator = QLabel("🎵 Audio" if audio_enabled else "Audio")
-        grey = theme_manager.get("grey")
-        self.audio_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid #666;
-                background: {primary if audio_enabled else 'transparent'};
-                color: {'white' if audio_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+        self.audio_indicator = QLabel()
+        self.audio_indicator.setObjectName("typeIndicator")
         self.audio_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.audio_indicator.setFixedSize(100, 35)
         type_layout.addWidget(self.audio_indicator)
         
         # Script indicator
-        script_enabled = self.scene_data.get("script_enabled", False)
-        self.script_indicator = QLabel("🎬 Script" if script_enabled else "Script")
-        self.script_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid #666;
-                background: {primary if script_enabled else 'transparent'};
-                color: {'white' if script_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+        self.script_indicator = QLabel()
+        self.script_indicator.setObjectName("typeIndicator")
         self.script_indicator.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.script_indicator.setFixedSize(100, 35)
         type_layout.addWidget(self.script_indicator)
+        self.update_indicators()
         
         layout.addWidget(type_widget)
         
@@ -461,45 +585,13 @@ class EnhancedSceneRow(QWidget):
         actions_layout.setAlignment(Qt.AlignmentFlag.AlignVCenter)
         
         self.test_btn = QPushButton("Test")
-        green = theme_manager.get("green")
-        green_gradient = theme_manager.get("green_gradient", f"qlineargradient(x1:0, y1:0, x2:0, y2:1, stop:0 {green}, stop:1 #2d8f2d)")
-        self.test_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: {green_gradient};
-                border: 2px solid {green};
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #55dd55, stop:1 {green});
-            }}
-        """)
+        self.test_btn.setObjectName("sceneTestButton")
         self.test_btn.setFixedSize(70, 35)
         self.test_btn.clicked.connect(self.test_scene)
         actions_layout.addWidget(self.test_btn)
         
         self.delete_btn = QPushButton("Delete")
-        red = theme_manager.get("red")
-        self.delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {red}, stop:1 #8b2635);
-                border: 2px solid {red};
-                border-radius: 6px;
-                color: white;
-                font-weight: bold;
-                font-size: 14px;
-                padding: 8px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ee5555, stop:1 {red});
-            }}
-        """)
+        self.delete_btn.setObjectName("sceneDeleteButton")
         self.delete_btn.setFixedSize(80, 35)
         self.delete_btn.clicked.connect(self.delete_scene)
         actions_layout.addWidget(self.delete_btn)
@@ -509,8 +601,8 @@ class EnhancedSceneRow(QWidget):
 
     def create_details_row(self):
         self.details_widget = QWidget()
+        self.details_widget.setObjectName("sceneDetails")
         self.details_widget.setFixedHeight(75)
-        self.update_details_style()
         
         layout = QHBoxLayout(self.details_widget)
         layout.setContentsMargins(20, 15, 25, 15)
@@ -518,265 +610,119 @@ class EnhancedSceneRow(QWidget):
         
         # Audio section
         self.audio_cb = QCheckBox("Audio:")
-        self.audio_cb.setChecked(self.scene_data.get("audio_enabled", False))
-        self.update_checkbox_style(self.audio_cb)
         
         # Audio file dropdown
         self.audio_file_combo = QComboBox()
-        self.audio_file_combo.addItems(self.audio_files)
-        current_audio = self.scene_data.get("audio_file", "")
-        if current_audio and current_audio in self.audio_files:
-            self.audio_file_combo.setCurrentText(current_audio)
-        elif self.audio_files:
-            self.audio_file_combo.setCurrentIndex(0)
-        
-        self.audio_file_combo.setEnabled(self.audio_cb.isChecked())
-        self.update_combo_style(self.audio_file_combo)
-        
-        self.audio_cb.stateChanged.connect(
-            lambda state: self.audio_file_combo.setEnabled(state == Qt.CheckState.Checked)
-        )
-        self.audio_cb.stateChanged.connect(self.update_indicators)
+        self.audio_file_combo.setModel(self.audio_model)
         
         layout.addWidget(self.audio_cb)
         layout.addWidget(self.audio_file_combo)
         
         # Script section
         self.script_cb = QCheckBox("Script:")
-        self.script_cb.setChecked(self.scene_data.get("script_enabled", False))
-        self.update_checkbox_style(self.script_cb)
         
         # Script input
         self.script_input = QLineEdit()
-        script_value = self.scene_data.get("script_name", "")
-        if script_value and script_value != 0:
-            self.script_input.setText(str(script_value))
-        else:
-            self.script_input.setText("")
-        
         self.script_input.setPlaceholderText("Script #")
-        self.script_input.setEnabled(self.script_cb.isChecked())
-        self.update_script_input_style()
-        
-        def update_script_input_enabled():
-            enabled = self.script_cb.isChecked()
-            self.script_input.setEnabled(enabled)
-        
-        self.script_input.textChanged.connect(self.validate_script_input)
-        self.script_cb.stateChanged.connect(lambda: update_script_input_enabled())
-        self.script_cb.stateChanged.connect(self.update_indicators)
+        # Digits only, rejected at input time rather than filtered after the fact
+        self.script_input.setValidator(QIntValidator(0, 9999, self.script_input))
         
         layout.addWidget(self.script_cb)
         layout.addWidget(self.script_input)
         
         # Duration section
         duration_label = QLabel("Duration:")
-        duration_label.setStyleSheet("color: white; font-weight: bold; font-size: 13px; min-width: 65px; border: none; background: transparent;")
+        duration_label.setMinimumWidth(65)
         
         self.duration_spin = QDoubleSpinBox()
         self.duration_spin.setRange(0.1, 99.9)
         self.duration_spin.setSingleStep(0.1)
-        self.duration_spin.setValue(self.scene_data.get("duration", 1.0))
         self.duration_spin.setSuffix("s")
-        self.update_spin_style(self.duration_spin)
         
         layout.addWidget(duration_label)
         layout.addWidget(self.duration_spin)
         
         # Delay section
         delay_label = QLabel("Delay:")
-        delay_label.setStyleSheet("color: white; font-weight: bold; font-size: 13px; min-width: 45px; border: none; background: transparent;")
+        delay_label.setMinimumWidth(45)
         
         self.delay_spin = QSpinBox()
         self.delay_spin.setRange(0, 10000)
-        self.delay_spin.setValue(self.scene_data.get("delay", 0))
         self.delay_spin.setSuffix("ms")
-        self.delay_spin.setEnabled(self.audio_cb.isChecked() and self.script_cb.isChecked())
-        self.update_spin_style(self.delay_spin)
-        
-        def update_delay_enabled():
-            self.delay_spin.setEnabled(self.audio_cb.isChecked() and self.script_cb.isChecked())
-        
-        self.audio_cb.stateChanged.connect(update_delay_enabled)
-        self.script_cb.stateChanged.connect(update_delay_enabled)
         
         layout.addWidget(delay_label)
         layout.addWidget(self.delay_spin)
         layout.addStretch()
         
-        self.main_layout.addWidget(self.details_widget)
-        
-    def update_details_style(self):
-        """Update details styling when theme changes"""
-        expanded_bg = theme_manager.get("expanded_bg")
-        grey = theme_manager.get("grey")
-        
-        self.details_widget.setStyleSheet(f"""
-            QWidget {{
-                background: {expanded_bg};
-                border: 2px solid {grey};
-                border-top: none;
-                border-radius: 0px 0px 8px 8px;
-                margin: 2px;
-                margin-top: 0px;
-            }}
-        """)
-    
-    def update_checkbox_style(self, checkbox):
-        """Update checkbox styling"""
-        primary = theme_manager.get("primary_color")
-        grey = theme_manager.get("grey")
+        # One slot per checkbox keeps every dependent widget in step
+        self.audio_cb.stateChanged.connect(self._on_audio_script_toggled)
+        self.script_cb.stateChanged.connect(self._on_audio_script_toggled)
+        self.audio_file_combo.currentTextChanged.connect(lambda text: self.update_state("audio_file", text))
+        self.script_input.textChanged.connect(lambda text: self.update_state("script_name", text))
+        self.duration_spin.valueChanged.connect(lambda value: self.update_state("duration", value))
+        self.delay_spin.valueChanged.connect(lambda value: self.update_state("delay", value))
         
-        checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: white;
-                font-weight: bold;
-                font-size: 13px;
-                min-width: 60px;
-                border: none;
-                background: transparent;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {primary};
-                border: 2px solid {primary};
-                border-radius: 3px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: #555;
-                border: 2px solid {grey};
-                border-radius: 3px;
-            }}
-        """)
+        self.set_detail_values()
+        self.main_layout.addWidget(self.details_widget)
     
-    def update_combo_style(self, combo):
-        """Update combobox styling"""
-        card_bg = theme_manager.get("card_bg")
-        primary = theme_manager.get("primary_color")
-        grey = theme_manager.get("grey")
+    def set_detail_values(self):
+        """Load scene_data into the details widgets without re-entering their slots"""
+        data = self.scene_data
+        with QSignalBlocker(self.audio_cb), QSignalBlocker(self.audio_file_combo), \
+                QSignalBlocker(self.script_cb), QSignalBlocker(self.script_input), \
+                QSignalBlocker(self.duration_spin), QSignalBlocker(self.delay_spin):
+            self.audio_cb.setChecked(data.get("audio_enabled", False))
+            
+            current_audio = data.get("audio_file", "")
+            audio_index = self.parent_screen.audio_file_index.get(current_audio, -1) if current_audio else -1
+            # A saved file missing from the list shows no selection; scene_data keeps it
+            self.audio_file_combo.setCurrentIndex(audio_index)
+            
+            self.script_cb.setChecked(data.get("script_enabled", False))
+            script_value = data.get("script_name", "")
+            self.script_input.setText(str(script_value) if script_value else "")
+            
+            self.duration_spin.setValue(data.get("duration", 1.0))
+            self.delay_spin.setValue(data.get("delay", 0))
         
-        combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {card_bg};
-                border: 2px solid {primary};
-                border-radius: 4px;
-                color: {primary};
-                padding: 4px 8px;
-                font-size: 12px;
-                min-height: 25px;
-                min-width: 200px;
-            }}
-            QComboBox:disabled {{
-                background-color: #333;
-                border-color: {grey};
-                color: {grey};
-            }}
-            QComboBox::drop-down {{
-                border: none;
-                width: 20px;
-            }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {primary};
-                margin-right: 5px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {card_bg};
-                border: 2px solid {primary};
-                color: {primary};
-                selection-background-color: {primary};
-                selection-color: black;
-            }}
-        """)
+        # Dependent enabled states and indicators are synced once, after all values are in
+        self._on_audio_script_toggled()
     
-    def update_script_input_style(self):
-        """Update script input styling"""
-        card_bg = theme_manager.get("card_bg")
-        primary = theme_manager.get("primary_color")
-        grey = theme_manager.get("grey")
-        
-        self.script_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: {card_bg};
-                border: 2px solid {primary};
-                border-radius: 4px;
-                color: {primary};
-                padding: 4px 8px;
-                font-size: 12px;
-                min-height: 25px;
-                max-width: 80px;
-            }}
-            QLineEdit:disabled {{
-                background-color: #333;
-                border-color: {grey};
-                color: {grey};
-            }}
-            QLineEdit::placeholder {{
-                color: {grey};
-            }}
-        """)
+    def _on_audio_script_toggled(self):
+        """Sync enabled states and indicators after the audio or script checkbox changes"""
+        audio_enabled = self.audio_cb.isChecked()
+        script_enabled = self.script_cb.isChecked()
+        self.update_state("audio_enabled", audio_enabled)
+        self.update_state("script_enabled", script_enabled)
+        self.audio_file_combo.setEnabled(audio_enabled)
+        self.script_input.setEnabled(script_enabled)
+        self.delay_spin.setEnabled(audio_enabled and script_enabled)
+        self.update_indicators()
     
-    def update_spin_style(self, spin_widget):
-        """Update spinbox styling"""
-        card_bg = theme_manager.get("card_bg")
-        primary = theme_manager.get("primary_color")
+    def update_state(self, key, value):
+        """Record a widget edit in scene_data"""
+        if self.scene_data.get(key) != value:
+            self.scene_data[key] = value
+            self.parent_screen.scenes_edited = True
         
-        spin_widget.setStyleSheet(f"""
-            QDoubleSpinBox, QSpinBox {{
-                background-color: {card_bg};
-                border: 2px solid {primary};
-                border-radius: 4px;
-                color: white;
-                padding: 4px 6px 8px 6px;
-                font-size: 12px;
-                min-height: 25px;
-                max-width: 70px;
-            }}
-        """)
-    
-    def validate_script_input(self, text):
-        """Only allow digits in script input"""
-        if text and not text.isdigit():
-            filtered_text = ''.join(c for c in text if c.isdigit())
-            self.script_input.setText(filtered_text)
-    
     def update_indicators(self):
-        """Update the type indicators based on checkbox states"""
-        audio_enabled = self.audio_cb.isChecked()
-        script_enabled = self.script_cb.isChecked()
-        primary = theme_manager.get("primary_color")
+        """Update the type indicators based on the audio/script state"""
+        audio_enabled = self.scene_data.get("audio_enabled", False)
+        script_enabled = self.scene_data.get("script_enabled", False)
         grey = theme_manager.get("grey")
         
-        self.audio_indicator.setText("🎵 Audio" if audio_enabled else "Audio")
-        self.audio_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid {'#666' if not audio_enabled else primary};
-                background: {primary if audio_enabled else 'transparent'};
-                color: {'white' if audio_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+        # Pre-rendered labels: the emoji text is shaped once per state, not per toggle
+        self.audio_indicator.setPixmap(indicator_pixmap(
+            "🎵 Audio" if audio_enabled else "Audio", "white" if audio_enabled else grey))
+        self.audio_indicator.setProperty("on", audio_enabled)
+        repolish(self.audio_indicator)
         
-        self.script_indicator.setText("🎬 Script" if script_enabled else "Script")
-        self.script_indicator.setStyleSheet(f"""
-            QLabel {{
-                font-size: 14px;
-                border: 2px solid {'#666' if not script_enabled else primary};
-                background: {primary if script_enabled else 'transparent'};
-                color: {'white' if script_enabled else grey};
-                padding: 4px;
-                font-weight: bold;
-            }}
-        """)
+        self.script_indicator.setPixmap(indicator_pixmap(
+            "🎬 Script" if script_enabled else "Script", "white" if script_enabled else grey))
+        self.script_indicator.setProperty("on", script_enabled)
+        repolish(self.script_indicator)
     
-    def toggle_expansion(self, event):
+    def toggle_expansion(self):
         """Toggle the expansion state"""
         if self.is_expanded:
             self.collapse()
@@ -785,21 +731,24 @@ class EnhancedSceneRow(QWidget):
     
     def expand(self):
         """Expand to show details"""
-        if not self.is_expanded:
-            self.is_expanded = True
-            self.expand_indicator.setText("▼")
-            self.update_expand_indicator_style()  # Use theme-aware styling
-            self.details_widget.show()
-            self.update_main_row_style()
+        self.set_expanded(True)
     
     def collapse(self):
         """Collapse to hide details"""
-        if self.is_expanded:
-            self.is_expanded = False
-            self.expand_indicator.setText("▶")
-            self.update_expand_indicator_style()  # Use theme-aware styling
-            self.details_widget.hide()
-            self.update_main_row_style()
+        self.set_expanded(False)
+    
+    def set_expanded(self, expanded):
+        """Switch expansion state; the container stylesheet styles both states"""
+        if expanded == self.is_expanded:
+            return
+        self.is_expanded = expanded
+        self.expand_indicator.setText("▼" if expanded else "▶")
+        for widget in (self.main_row, self.expand_indicator):
+            widget.setProperty("expanded", expanded)
+            repolish(widget)
+        if expanded and self.details_widget is None:
+            self.create_details_row()
+        self.details_widget.setVisible(expanded)
     
     def test_scene(self):
         """Test this scene"""
@@ -808,46 +757,98 @@ class EnhancedSceneRow(QWidget):
     
     def delete_scene(self):
         """Delete this scene"""
-        self.parent_screen.delete_scene_row(self.row_index)
+        self.parent_screen.delete_scene_row(self)
     
     def get_scene_data(self):
-        """Extract current scene data from widgets"""
-        script_value = self.script_input.text().strip()
-        if script_value.isdigit():
-            script_num = int(script_value)
-        else:
-            script_num = None
-        
-        audio_file = self.audio_file_combo.currentText() if self.audio_cb.isChecked() else ""
+        """Build normalized scene data from the row state (no widget reads)"""
+        data = self.scene_data
+        audio_enabled = data.get("audio_enabled", False)
+        script_enabled = data.get("script_enabled", False)
+        script_value = str(data.get("script_name") or "").strip()
+        script_num = int(script_value) if script_value.isdigit() else None
         
         return {
-            "label": self.name_edit.text().strip(),
+            "label": data.get("label", "").strip(),
             "emoji": "🎭",  # Default emoji
-            "categories": self.category_selector.get_selected_categories(),
-            "audio_enabled": self.audio_cb.isChecked(),
-            "audio_file": audio_file,
-            "script_enabled": self.script_cb.isChecked(),
-            "script_name": script_num if (self.script_cb.isChecked() and script_num is not None) else None,
-            "duration": self.duration_spin.value(),
-            "delay": self.delay_spin.value() if (self.audio_cb.isChecked() and self.script_cb.isChecked()) else 0
+            "categories": list(data.get("categories", [])),
+            "audio_enabled": audio_enabled,
+            "audio_file": data.get("audio_file", "") if audio_enabled else "",
+            "script_enabled": script_enabled,
+            "script_name": script_num if (script_enabled and script_num is not None) else None,
+            "duration": data.get("duration", 1.0),
+            "delay": data.get("delay", 0) if (audio_enabled and script_enabled) else 0
         }
 
 class SceneScreen(BaseScreen):
     """Interface for managing emotion scenes and audio mappings with enhanced accordion layout"""
     
     scenes_updated = pyqtSignal()  # Signal to notify HomeScreen of changes
+    
+    # Above this many new rows a reload builds a fresh container instead of editing the live one
+    CONTAINER_SWAP_THRESHOLD = 30
+    
+    # Default scene schema; copy it and give each scene its own categories list
+    SCENE_TEMPLATE = MappingProxyType({
+        "label": "",
+        "emoji": "🎭",
+        "categories": (),
+        "audio_enabled": False,
+        "audio_file": "",
+        "script_enabled": False,
+        "script_name": 0,
+        "duration": 2.0,
+        "delay": 0
+    })
+    
+    # Fields carried over from emotion_buttons.json; the old format defaulted to one second
+    OLD_FORMAT_KEYS = ("label", "audio_enabled", "audio_file", "script_enabled", "script_name", "duration", "delay")
+    OLD_FORMAT_TEMPLATE = MappingProxyType(dict(SCENE_TEMPLATE, duration=1.0))
+    
+    SCENES_CONFIG_PATH = "resources/configs/scenes_config.json"
 
     def _setup_screen(self):
         self.setFixedWidth(1200)
         self.scenes_data = []
+        self.scenes_fingerprint = None  # Hash of the last scene list shown or saved
+        self.scenes_edited = False  # Rows hold changes not in scenes_fingerprint
         self.audio_files = []
+        self.audio_model = QStringListModel(self.audio_files, self)
+        self.audio_model_files = ()  # Snapshot of the list audio_model currently holds
+        self.audio_file_index = {}  # File name -> row in audio_model, for O(1) combo restores
         self.scene_rows = []
+        self.pending_save_replies = 0  # Backend saves sent but not yet acknowledged
+        self.message_boxes = {}  # One reusable QMessageBox per icon type
+        
+        # Backend message type -> handler, looked up once per decoded message
+        self.message_handlers = {
+            "scene_list": self.handle_scene_list,
+            "audio_files": self.handle_audio_files,
+            "scenes_saved": self.handle_scenes_saved
+        }
+        
+        # Changes within one event loop pass reach HomeScreen as a single signal
+        self.scenes_updated_timer = QTimer(self)
+        self.scenes_updated_timer.setSingleShot(True)
+        self.scenes_updated_timer.timeout.connect(self.scenes_updated.emit)
         
         # Register for theme changes
         theme_manager.register_callback(self.update_theme)
         
         self.init_ui()
         
+        # Messages are decoded in order on a single worker thread
+        self.parse_pool = QThreadPool(self)
+        self.parse_pool.setMaxThreadCount(1)
+        self.parse_signals = MessageParseSignals(self)
+        self.parse_signals.parsed.connect(self.process_message, Qt.ConnectionType.QueuedConnection)
+        self.parse_signals.failed.connect(self.on_message_parse_failed, Qt.ConnectionType.QueuedConnection)
+        
+        # Local saves run one at a time so later writes never land first
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        self.save_signals = ConfigSaveSignals(self)
+        self.save_signals.finished.connect(self.on_local_save_finished, Qt.ConnectionType.QueuedConnection)
+        
         if self.websocket:
             self.websocket.textMessageReceived.connect(self.handle_message)
             # Wait for connection before requesting audio files
@@ -871,10 +872,10 @@ class SceneScreen(BaseScreen):
         """Update all UI elements when theme changes"""
         self.update_main_frame_style()
         self.update_scroll_area_style()
-        self.update_button_styles()
-        self.update_status_label_style()
+        self.controls_container.setStyleSheet(get_themed_qss(SCENE_CONTROLS_QSS_PATH))
         
-        # Update all scene rows
+        # One sheet styles every scene row; rows only refresh their own selectors
+        self.scenes_container.setStyleSheet(get_scene_rows_qss())
         for row in self.scene_rows:
             row.update_theme()
 
@@ -923,47 +924,6 @@ class SceneScreen(BaseScreen):
             }}
         """)
 
-    def update_button_styles(self):
-        """Update button styling"""
-        # Update add button
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        
-        self.add_btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {primary_light}, stop:1 {primary});
-                border: 3px solid {primary};
-                border-radius: 10px;
-                color: black;
-                font-weight: bold;
-                padding: 15px 25px;
-                min-width: 180px;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f8d547, stop:1 {primary_light});
-            }}
-        """)
-        
-        # Update other buttons
-        self.refresh_btn.setStyleSheet(self.get_enhanced_button_style(False))
-        self.save_btn.setStyleSheet(self.get_enhanced_button_style(False))
-
-    def update_status_label_style(self):
-        """Update status label styling"""
-        primary = theme_manager.get("primary_color")
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {primary};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                background: transparent;
-                border: none;
-            }}
-        """)
-
     def init_ui(self):
         self.layout = QVBoxLayout()
         self.layout.setContentsMargins(100, 25, 40, 10)
@@ -987,124 +947,153 @@ class SceneScreen(BaseScreen):
         self.scroll.setMaximumHeight(520)
         self.update_scroll_area_style()
         
+        # Materialize scene rows lazily as they scroll into view
+        self.materialize_timer = QTimer(self)
+        self.materialize_timer.setSingleShot(True)
+        self.materialize_timer.timeout.connect(self.materialize_visible_rows)
+        scrollbar = self.scroll.verticalScrollBar()
+        scrollbar.valueChanged.connect(self.schedule_materialize)
+        scrollbar.rangeChanged.connect(self.schedule_materialize)
+        
         main_container = QWidget()
-        main_layout = QVBoxLayout(main_container)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-        
-        self.scenes_container = QWidget()
-        self.scenes_container.setMinimumWidth(900)
-        self.scenes_layout = QVBoxLayout(self.scenes_container)
-        self.scenes_layout.setContentsMargins(10, 10, 10, 10)
-        self.scenes_layout.setSpacing(4)
-        self.scenes_layout.addStretch()
-        
-        main_layout.addWidget(self.scenes_container)
+        self.scenes_host_layout = QVBoxLayout(main_container)
+        self.scenes_host_layout.setContentsMargins(0, 0, 0, 0)
+        self.scenes_host_layout.setSpacing(0)
+        
+        self.scenes_container, self.scenes_layout = self.create_scenes_container()
+        
+        self.scenes_host_layout.addWidget(self.scenes_container)
         self.scroll.setWidget(main_container)
         parent_layout.addWidget(self.scroll)
 
+    def create_scenes_container(self):
+        """Create the widget and layout that hold the scene rows"""
+        container = QWidget()
+        container.setMinimumWidth(900)
+        # Installed on the nearest common ancestor so it overrides main_frame's rules
+        container.setStyleSheet(get_scene_rows_qss())
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(4)
+        # Pack rows at the top so new rows can simply be appended
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        return container, layout
+
+    def schedule_materialize(self, *args):
+        """Coalesce viewport changes into one materialize pass"""
+        if not self.materialize_timer.isActive():
+            self.materialize_timer.start(0)
+
+    def schedule_scenes_updated(self):
+        """Coalesce scene changes into one scenes_updated emission"""
+        if not self.scenes_updated_timer.isActive():
+            self.scenes_updated_timer.start(0)
+
+    def materialize_visible_rows(self):
+        """Build the widgets of placeholder rows within (or one page beyond) the viewport"""
+        if not self.scene_rows or not self.isVisible():
+            return
+        
+        page = self.scroll.viewport().height()
+        top = self.scroll.verticalScrollBar().value()
+        bottom = top + 2 * page
+        
+        # Rows are laid out top to bottom, so bisect to the first one reaching the viewport
+        first = bisect_left(self.scene_rows, top, key=lambda row: row.y() + row.height())
+        pending = []
+        for row in islice(self.scene_rows, first, None):
+            if row.y() > bottom:
+                break
+            if not row.is_materialized:
+                pending.append(row)
+        
+        # Rows well outside the window go back to placeholders so the number
+        # of live widgets tracks the viewport rather than the scene count
+        keep_top = top - 2 * page
+        keep_bottom = bottom + 2 * page
+        stale = [row for row in self.scene_rows
+                 if row.is_materialized and (row.y() + row.height() < keep_top or row.y() > keep_bottom)]
+        if not pending and not stale:
+            return
+        
+        # Build the whole batch before the container repaints or relayouts
+        self.scenes_container.setUpdatesEnabled(False)
+        try:
+            for row in stale:
+                row.dematerialize()
+            for row in pending:
+                row.materialize()
+        finally:
+            self.scenes_container.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.schedule_materialize()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_materialize()
+
     def create_enhanced_control_buttons(self, parent_layout):
-        btn_container = QWidget()
-        btn_container.setFixedHeight(80)
-        btn_layout = QHBoxLayout(btn_container)
+        # The control bar's buttons and status label share one stylesheet
+        self.controls_container = QWidget()
+        self.controls_container.setFixedHeight(80)
+        self.controls_container.setStyleSheet(get_themed_qss(SCENE_CONTROLS_QSS_PATH))
+        btn_layout = QHBoxLayout(self.controls_container)
         btn_layout.setContentsMargins(0, 5, 0, 5)
         btn_layout.setSpacing(20)
         
         # Add Scene button
         self.add_btn = QPushButton("✨ Add New Scene")
-        self.add_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.add_btn.setObjectName("addSceneButton")
+        self.add_btn.setFont(get_font(16, QFont.Weight.Bold))
         self.add_btn.clicked.connect(lambda: self.add_scene())
         
         # Status indicator
-        self.status_label = QLabel("Ready")
-        primary = theme_manager.get("primary_color")
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {primary};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                background: transparent;
-                border: none;
-            }}
-        """)
+        self.status_message = "Ready"
+        self.status_state = "info"
+        self.pending_status = None
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.timeout.connect(self.apply_pending_status)
+        self.status_label = QLabel(self.status_message)
+        self.status_label.setObjectName("statusLabel")
+        self.status_label.setProperty("state", self.status_state)
         
         # Action buttons
         self.refresh_btn = QPushButton("🔄 Refresh from Backend")
+        self.refresh_btn.setProperty("variant", "secondary")
         self.refresh_btn.clicked.connect(lambda: self.refresh_from_backend())
         
         self.save_btn = QPushButton("💾 Save Configuration")
+        self.save_btn.setProperty("variant", "secondary")
         self.save_btn.clicked.connect(lambda: self.save_config())
         
-        # Apply initial styling
-        self.update_button_styles()
-        
         btn_layout.addWidget(self.add_btn)
         btn_layout.addWidget(self.status_label)
         btn_layout.addStretch()
         btn_layout.addWidget(self.refresh_btn)
         btn_layout.addWidget(self.save_btn)
         
-        parent_layout.addWidget(btn_container)
-
-    def get_enhanced_button_style(self, primary=False):
-        if primary:
-            primary_color = theme_manager.get("primary_color")
-            primary_light = theme_manager.get("primary_light")
-            return f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {primary_light}, stop:1 {primary_color});
-                    border: 3px solid {primary_color};
-                    border-radius: 10px;
-                    color: black;
-                    font-weight: bold;
-                    padding: 15px 25px;
-                    font-size: 16px;
-                    min-width: 150px;
-                }}
-            """
-        else:
-            primary = theme_manager.get("primary_color")
-            return f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #4a4a4a, stop:1 #2a2a2a);
-                    border: 2px solid #666;
-                    border-radius: 8px;
-                    color: #ccc;
-                    font-weight: bold;
-                    padding: 12px 20px;
-                    font-size: 14px;
-                    min-width: 140px;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #5a5a5a, stop:1 #3a3a3a);
-                    border: 2px solid {primary};
-                    color: {primary};
-                }}
-            """
+        parent_layout.addWidget(self.controls_container)
 
     @error_boundary
     def request_audio_files(self):
-        primary = theme_manager.get("primary_color")
-        
         # Check if WebSocket is connected
         if not self.websocket or not self.websocket.is_connected():
             self.logger.warning("WebSocket not connected - using fallback audio list")
             self.use_fallback_audio_files()
             return
         
-        self.update_status("Requesting audio files...", primary)
-        success = self.send_websocket_message("get_audio_files")
+        self.update_status("Requesting audio files...")
+        success = self.send_websocket_text(GET_AUDIO_FILES_MESSAGE)
         if not success:
             self.logger.warning("Failed to request audio files - using fallback list")
             self.use_fallback_audio_files()
 
     def use_fallback_audio_files(self):
         """Set fallback audio files and update all UI elements"""
-        self.update_status("Using fallback audio list", "orange")
+        self.update_status("Using fallback audio list", "warn")
         self.audio_files = [
             "Audio Files Not Found.MP3"
         ]
@@ -1115,8 +1104,7 @@ class SceneScreen(BaseScreen):
     @error_boundary
     def refresh_from_backend(self):
         """Refresh both scenes and audio files from backend in parallel"""
-        primary = theme_manager.get("primary_color")
-        self.update_status("Refreshing from backend...", primary)
+        self.update_status("Refreshing from backend...")
         
         # Initialize refresh tracking
         self.refresh_status = {
@@ -1129,116 +1117,132 @@ class SceneScreen(BaseScreen):
         }
         
         # Send both requests in parallel
-        scenes_success = self.send_websocket_message("get_scenes")
-        audio_success = self.send_websocket_message("get_audio_files")
+        scenes_success = self.send_websocket_text(GET_SCENES_MESSAGE)
+        audio_success = self.send_websocket_text(GET_AUDIO_FILES_MESSAGE)
         
         if not (scenes_success or audio_success):
-            self.update_status("Backend unavailable - keeping local data", "orange")
+            self.update_status("Backend unavailable - keeping local data", "warn")
             self.logger.warning("Failed to refresh from backend")
 
-    def update_status(self, message, color=None):
-        """Update the status indicator"""
-        if color is None:
-            color = theme_manager.get("primary_color")
-        self.status_label.setText(message)
-        self.status_label.setStyleSheet(f"""
-            QLabel {{
-                color: {color};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 10px;
-                background: transparent;
-                border: none;
-            }}
-        """)
+    def show_message(self, icon, title, text, buttons=QMessageBox.StandardButton.Ok):
+        """Show a modal message box, reusing one instance per icon type"""
+        box = self.message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, title, text, buttons, self)
+            self.message_boxes[icon] = box
+        else:
+            box.setWindowTitle(title)
+            box.setText(text)
+            box.setStandardButtons(buttons)
+        return QMessageBox.StandardButton(box.exec())
+
+    def update_status(self, message, state="info"):
+        """Update the status indicator; state is one of info, ok, warn or error"""
+        # Bursts within one event loop pass only paint the last status
+        self.pending_status = (message, state)
+        if not self.status_timer.isActive():
+            self.status_timer.start(0)
+
+    def apply_pending_status(self):
+        """Show the most recent status passed to update_status"""
+        if self.pending_status is None:
+            return
+        message, state = self.pending_status
+        self.pending_status = None
+        
+        # Repeated messages during a refresh leave the label untouched
+        if message != self.status_message:
+            self.status_message = message
+            self.status_label.setText(message)
+        if state != self.status_state:
+            self.status_state = state
+            self.status_label.setProperty("state", state)
+            repolish(self.status_label)
 
-    @error_boundary
     def handle_message(self, message: str):
+        """Queue an incoming frame for decoding; the result arrives in process_message"""
+        self.parse_pool.start(MessageParseTask(message, self.parse_signals))
+
+    def on_message_parse_failed(self, error: str):
+        """Handle a frame that could not be decoded"""
+        self.logger.error(f"Failed to handle message: {error}")
+        self.update_status("Communication error", "error")
+
+    @error_boundary
+    def process_message(self, msg):
         try:
-            msg = json.loads(message)
-            msg_type = msg.get("type")
-            
-            green = theme_manager.get("green")
-            red = theme_manager.get("red")
-            
-            if msg_type == "scene_list":
-                scenes = msg.get("scenes", [])
-                if scenes:
-                    self.scenes_data = scenes
-                    self.update_scene_rows()
-                    # Update refresh tracking
-                    if hasattr(self, 'refresh_status'):
-                        self.refresh_status["scenes_complete"] = True
-                        self.refresh_status["scenes_count"] = len(scenes)
-                        self.refresh_status["scenes_success"] = True
-                        self.check_refresh_completion()
-                    else:
-                        self.update_status(f"Loaded {len(scenes)} scenes from backend", green)
-                else:
-                    self.logger.warning("No scenes received from backend")
-                    if hasattr(self, 'refresh_status'):
-                        self.refresh_status["scenes_complete"] = True
-                        self.refresh_status["scenes_success"] = False
-                        self.check_refresh_completion()
-                    else:
-                        self.update_status("No scenes from backend", "orange")
-                    
-            elif msg_type == "audio_files":
-                files = msg.get("files", [])
-                if files:
-                    self.audio_files = files
-                    self.logger.info(f"Loaded {len(files)} audio files from backend")
-                    for row in self.scene_rows:
-                        row.audio_files = files
-                        current_selection = row.audio_file_combo.currentText()
-                        row.audio_file_combo.clear()
-                        row.audio_file_combo.addItems(files)
-                        if current_selection in files:
-                            row.audio_file_combo.setCurrentText(current_selection)
-                        elif files:
-                            row.audio_file_combo.setCurrentIndex(0)
-                    # Update refresh tracking
-                    if hasattr(self, 'refresh_status'):
-                        self.refresh_status["audio_complete"] = True
-                        self.refresh_status["audio_count"] = len(files)
-                        self.refresh_status["audio_success"] = True
-                        self.check_refresh_completion()
-                    else:
-                        self.update_status(f"Loaded {len(files)} audio files", green)
-                else:
-                    self.logger.warning("No audio files received from backend")
-                    if hasattr(self, 'refresh_status'):
-                        self.refresh_status["audio_complete"] = True
-                        self.refresh_status["audio_success"] = False
-                        self.check_refresh_completion()
-                    else:
-                        self.update_status("No audio files from backend", "orange")
-
-                    
-            elif msg_type == "scenes_saved":
-                success = msg.get("success", False)
-                if success:
-                    QMessageBox.information(self, "Saved", "Scenes saved successfully to backend.")
-                    self.update_status("Saved successfully", green)
-                    self.scenes_updated.emit()
-                else:
-                    error = msg.get("error", "Unknown error")
-                    QMessageBox.critical(self, "Error", f"Failed to save to backend: {error}")
-                    self.update_status("Save failed", red)
-                    
+            handler = self.message_handlers.get(msg.get("type"))
+            if handler:
+                handler(msg)
         except Exception as e:
-            red = theme_manager.get("red")
             self.logger.error(f"Failed to handle message: {e}")
-            self.update_status("Communication error", red)
+            self.update_status("Communication error", "error")
+
+    def handle_scene_list(self, msg):
+        """Apply a scene_list reply"""
+        scenes = msg.get("scenes", [])
+        if scenes:
+            self.apply_scenes(scenes)
+            # Update refresh tracking
+            if hasattr(self, 'refresh_status'):
+                self.refresh_status["scenes_complete"] = True
+                self.refresh_status["scenes_count"] = len(scenes)
+                self.refresh_status["scenes_success"] = True
+                self.check_refresh_completion()
+            else:
+                self.update_status(f"Loaded {len(scenes)} scenes from backend", "ok")
+        else:
+            self.logger.warning("No scenes received from backend")
+            if hasattr(self, 'refresh_status'):
+                self.refresh_status["scenes_complete"] = True
+                self.refresh_status["scenes_success"] = False
+                self.check_refresh_completion()
+            else:
+                self.update_status("No scenes from backend", "warn")
+
+    def handle_audio_files(self, msg):
+        """Apply an audio_files reply"""
+        files = msg.get("files", [])
+        if files:
+            self.audio_files = files
+            self.logger.info(f"Loaded {len(files)} audio files from backend")
+            self.update_audio_files()
+            # Update refresh tracking
+            if hasattr(self, 'refresh_status'):
+                self.refresh_status["audio_complete"] = True
+                self.refresh_status["audio_count"] = len(files)
+                self.refresh_status["audio_success"] = True
+                self.check_refresh_completion()
+            else:
+                self.update_status(f"Loaded {len(files)} audio files", "ok")
+        else:
+            self.logger.warning("No audio files received from backend")
+            if hasattr(self, 'refresh_status'):
+                self.refresh_status["audio_complete"] = True
+                self.refresh_status["audio_success"] = False
+                self.check_refresh_completion()
+            else:
+                self.update_status("No audio files from backend", "warn")
+
+    def handle_scenes_saved(self, msg):
+        """Track a backend save acknowledgement"""
+        success = msg.get("success", False)
+        self.pending_save_replies = max(0, self.pending_save_replies - 1)
+        if success:
+            self.logger.info("Backend confirmed scene save")
+        elif self.pending_save_replies:
+            # A newer save is still in flight, so this failure is stale
+            self.logger.warning(f"Superseded backend save failed: {msg.get('error', 'Unknown error')}")
+        else:
+            error = msg.get("error", "Unknown error")
+            self.show_message(QMessageBox.Icon.Critical, "Error", f"Failed to save to backend: {error}")
+            self.update_status("Save failed", "error")
 
     def check_refresh_completion(self):
         """Check if refresh is complete and update status accordingly"""
         if not hasattr(self, 'refresh_status'):
             return
         
-        green = theme_manager.get("green")
-        red = theme_manager.get("red")
-        
         # Check if both are complete
         if self.refresh_status["scenes_complete"] and self.refresh_status["audio_complete"]:
             scenes_count = self.refresh_status["scenes_count"]
@@ -1247,13 +1251,13 @@ class SceneScreen(BaseScreen):
             audio_ok = self.refresh_status["audio_success"]
             
             if scenes_ok and audio_ok:
-                self.update_status(f"Loaded {scenes_count} scenes and {audio_count} audio files", green)
+                self.update_status(f"Loaded {scenes_count} scenes and {audio_count} audio files", "ok")
             elif scenes_ok:
-                self.update_status(f"Loaded {scenes_count} scenes, audio failed", "orange")
+                self.update_status(f"Loaded {scenes_count} scenes, audio failed", "warn")
             elif audio_ok:
-                self.update_status(f"Scenes failed, loaded {audio_count} audio files", "orange")
+                self.update_status(f"Scenes failed, loaded {audio_count} audio files", "warn")
             else:
-                self.update_status("Failed to load scenes and audio files", red)
+                self.update_status("Failed to load scenes and audio files", "error")
             
             # Clear refresh tracking
             del self.refresh_status
@@ -1262,107 +1266,145 @@ class SceneScreen(BaseScreen):
     def load_local_config(self):
         """Load from standardized path that matches backend"""
         # Try primary config path first (matches backend)
-        config = config_manager.get_config("resources/configs/scenes_config.json")
+        config = config_manager.get_config(self.SCENES_CONFIG_PATH)
         if isinstance(config, list) and config:
-            self.scenes_data = config
-            self.update_scene_rows()
-            primary = theme_manager.get("primary_color")
-            self.update_status(f"Loaded {len(self.scenes_data)} scenes from local cache", primary)
+            self.apply_scenes(config)
+            self.update_status(f"Loaded {len(self.scenes_data)} scenes from local cache")
             self.logger.debug(f"Loaded {len(self.scenes_data)} scenes from resources/configs/scenes_config.json")
             return
         
         # No config found - start with empty
         self.scenes_data = []
         self.update_scene_rows()
-        primary = theme_manager.get("primary_color")
-        self.update_status("No local config found - starting empty", primary)
+        self.update_status("No local config found - starting empty")
         self.logger.info("No local config found - starting with empty scene list")
 
     def convert_old_format(self, old_scenes):
         """Convert old emotion_buttons.json format to new scenes.json format"""
-        converted = []
-        for scene in old_scenes:
-            new_scene = {
-                "label": scene.get("label", ""),
-                "emoji": "🎭",
-                "categories": scene.get("categories", []),
-                "audio_enabled": scene.get("audio_enabled", False),
-                "audio_file": scene.get("audio_file", ""),
-                "script_enabled": scene.get("script_enabled", False),
-                "script_name": scene.get("script_name", 0),
-                "duration": scene.get("duration", 1.0),
-                "delay": scene.get("delay", 0)
-            }
-            converted.append(new_scene)
-        return converted
+        template = self.OLD_FORMAT_TEMPLATE
+        keys = self.OLD_FORMAT_KEYS
+        return [{
+            **template,
+            **{key: scene[key] for key in keys if key in scene},
+            "categories": scene.get("categories", [])
+        } for scene in old_scenes]
+
+    def apply_scenes(self, scenes):
+        """Show a scene list, skipping the rebuild when it matches what is already shown"""
+        fingerprint = hash(json_dumps(scenes))
+        if fingerprint == self.scenes_fingerprint and not self.scenes_edited:
+            self.logger.debug("Scene list unchanged - keeping existing rows")
+            return
+        self.scenes_fingerprint = fingerprint
+        self.scenes_edited = False
+        self.scenes_data = scenes
+        self.update_scene_rows()
 
     @error_boundary
     def update_scene_rows(self):
-        """Update the enhanced accordion scene rows"""
-        # Clear existing rows
-        for row in self.scene_rows:
-            row.setParent(None)
-        self.scene_rows.clear()
+        """Update the enhanced accordion scene rows, reusing existing rows where possible"""
+        self.scene_rows = [row for row in self.scene_rows if not sip.isdeleted(row)]
+        reuse = min(len(self.scene_rows), len(self.scenes_data))
+        if len(self.scenes_data) - reuse > self.CONTAINER_SWAP_THRESHOLD:
+            self.replace_scenes_container()
+            return
         
-        # Create new enhanced rows with proper parent reference
+        # Suspend repaints/layout signals so the rebuild costs one layout pass
+        self.scenes_container.setUpdatesEnabled(False)
+        self.scenes_layout.blockSignals(True)
+        try:
+            # Existing rows take the new data in place
+            for row, scene_data in zip(self.scene_rows, self.scenes_data):
+                row.load_scene(scene_data)
+            
+            # Drop surplus rows
+            for row in self.scene_rows[reuse:]:
+                row.release()
+            del self.scene_rows[reuse:]
+            
+            # Only scenes beyond the old row count need new widgets
+            for i in range(reuse, len(self.scenes_data)):
+                scene_row = EnhancedSceneRow(self.scenes_data[i], self.audio_model, i, self, materialize=False)
+                self.scene_rows.append(scene_row)
+                self.scenes_layout.addWidget(scene_row)
+        finally:
+            self.scenes_layout.blockSignals(False)
+            self.scenes_container.setUpdatesEnabled(True)
+            self.scenes_container.update()
+        
+        self.schedule_materialize()
+
+    def replace_scenes_container(self):
+        """Rebuild all rows in a detached container and swap it in whole"""
+        container, layout = self.create_scenes_container()
+        rows = []
         for i, scene_data in enumerate(self.scenes_data):
-            scene_row = EnhancedSceneRow(scene_data, self.audio_files, i, self)
-            self.scene_rows.append(scene_row)
-            # Insert before the stretch
-            self.scenes_layout.insertWidget(self.scenes_layout.count() - 1, scene_row)
+            scene_row = EnhancedSceneRow(scene_data, self.audio_model, i, self, materialize=False)
+            rows.append(scene_row)
+            layout.addWidget(scene_row)
+        
+        # Old rows go down with their container; only their theme hooks need dropping
+        for row in self.scene_rows:
+            if not sip.isdeleted(row):
+                theme_manager.unregister_callback(row.update_theme)
+        
+        old_container = self.scenes_container
+        self.scenes_host_layout.replaceWidget(old_container, container)
+        old_container.setParent(None)
+        old_container.deleteLater()
+        
+        self.scenes_container = container
+        self.scenes_layout = layout
+        self.scene_rows = rows
+        self.schedule_materialize()
 
     @error_boundary
     def add_scene(self):
-        new_scene = {
-            "label": f"New Scene {len(self.scenes_data) + 1}",
-            "emoji": "🎭",
-            "categories": [],
-            "audio_enabled": False,
-            "audio_file": "",
-            "script_enabled": False, 
-            "script_name": 0,
-            "duration": 2.0,
-            "delay": 0
-        }
+        new_scene = dict(self.SCENE_TEMPLATE, label=f"New Scene {len(self.scenes_data) + 1}", categories=[])
         
         self.scenes_data.append(new_scene)
+        self.scenes_edited = True
         
         # Create and add new enhanced row with proper parent reference
-        scene_row = EnhancedSceneRow(new_scene, self.audio_files, len(self.scene_rows), self)
+        scene_row = EnhancedSceneRow(new_scene, self.audio_model, len(self.scene_rows), self)
         self.scene_rows.append(scene_row)
-        self.scenes_layout.insertWidget(self.scenes_layout.count() - 1, scene_row)
+        self.scenes_layout.addWidget(scene_row)
         
         scene_row.collapse()
-        primary = theme_manager.get("primary_color")
-        self.update_status(f"Added new scene", primary)
+        self.update_status(f"Added new scene")
 
     @error_boundary
-    def delete_scene_row(self, row_index):
-        """Delete a scene row by index"""
-        if 0 <= row_index < len(self.scene_rows):
-            scene_row = self.scene_rows[row_index]
-            scene_name = scene_row.name_edit.text() or f"Scene {row_index + 1}"
+    def delete_scene_row(self, scene_row):
+        """Delete the given scene row"""
+        if scene_row in self.scene_rows:
+            scene_name = scene_row.scene_data.get("label") or "Unnamed scene"
             
-            reply = QMessageBox.question(
-                self, "Delete Scene", 
+            reply = self.show_message(
+                QMessageBox.Icon.Question, "Delete Scene",
                 f"Are you sure you want to delete '{scene_name}'?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             
             if reply == QMessageBox.StandardButton.Yes:
+                # Rows and scenes_data are kept index-aligned
+                row_index = self.scene_rows.index(scene_row)
+                
                 # Remove from data and UI
                 if row_index < len(self.scenes_data):
                     del self.scenes_data[row_index]
+                self.scenes_edited = True
                 
-                scene_row.setParent(None)
-                del self.scene_rows[row_index]
-                
-                # Update row indices for remaining rows
-                for i, row in enumerate(self.scene_rows):
-                    row.row_index = i
+                self.scenes_container.setUpdatesEnabled(False)
+                self.scenes_layout.blockSignals(True)
+                try:
+                    scene_row.release()
+                    del self.scene_rows[row_index]
+                finally:
+                    self.scenes_layout.blockSignals(False)
+                    self.scenes_container.setUpdatesEnabled(True)
+                    self.scenes_container.update()
                 
-                primary = theme_manager.get("primary_color")
-                self.update_status(f"Deleted scene: {scene_name}", primary)
+                self.update_status(f"Deleted scene: {scene_name}")
                 self.logger.info(f"Deleted scene: {scene_name} (index: {row_index})")
 
     @error_boundary
@@ -1370,8 +1412,7 @@ class SceneScreen(BaseScreen):
         """Test a scene with given data"""
         scene_name = scene_data.get("label", "Test Scene")
         self.logger.info(f"Testing scene: {scene_name}")
-        primary = theme_manager.get("primary_color")
-        self.update_status(f"Testing: {scene_name}", primary)
+        self.update_status(f"Testing: {scene_name}")
         
         # Send test command to backend
         test_data = {
@@ -1380,90 +1421,136 @@ class SceneScreen(BaseScreen):
         }
         success = self.send_websocket_message(test_data)
         if not success:
-            red = theme_manager.get("red")
-            self.update_status(f"Failed to test {scene_name}", red)
+            self.update_status(f"Failed to test {scene_name}", "error")
 
     @error_boundary
     def save_config(self):
         """Save configuration from accordion rows"""
-        primary = theme_manager.get("primary_color")
-        red = theme_manager.get("red")
-        
-        self.update_status("Validating configuration...", primary)
+        self.update_status("Validating configuration...")
         
-        # Validate unique names and collect data
-        names = []
+        # Validate non-empty, unique names while collecting data
+        seen = set()
         scene_data = []
         
         for row in self.scene_rows:
             scene = row.get_scene_data()
-            names.append(scene["label"])
+            name = scene["label"]
+            if not name.strip():
+                self.show_message(QMessageBox.Icon.Critical, "Error", "All scenes must have names.")
+                self.update_status("Validation failed: Empty names", "error")
+                return
+            if name in seen:
+                self.show_message(QMessageBox.Icon.Critical, "Error", "Scene names must be unique.")
+                self.update_status("Validation failed: Duplicate names", "error")
+                return
+            seen.add(name)
             scene_data.append(scene)
         
-        # Check for unique names
-        if len(names) != len(set(names)):
-            QMessageBox.critical(self, "Error", "Scene names must be unique.")
-            self.update_status("Validation failed: Duplicate names", red)
-            return
-        
-        # Check for empty names
-        if any(not name.strip() for name in names):
-            QMessageBox.critical(self, "Error", "All scenes must have names.")
-            self.update_status("Validation failed: Empty names", red)
-            return
-        
-        self.update_status("Saving configuration...", primary)
+        self.update_status("Saving configuration...")
         
-        # Save locally first using standardized path
-        success = config_manager.save_config("resources/configs/scenes_config.json", scene_data)
+        # Save locally first using standardized path; the write completes in on_local_save_finished
+        self.save_pool.start(ConfigSaveTask(self.SCENES_CONFIG_PATH, scene_data, self.save_signals))
+
+    @error_boundary
+    def on_local_save_finished(self, success, scene_data):
+        """Sync to the backend once the local save has been written"""
         if not success:
-            QMessageBox.critical(self, "Error", "Failed to save local configuration.")
-            self.update_status("Local save failed", red)
+            self.show_message(QMessageBox.Icon.Critical, "Error", "Failed to save local configuration.")
+            self.update_status("Local save failed", "error")
             return
         
+        # The cache is only touched here on the GUI thread, never by the worker
+        config_manager.update_cache(self.SCENES_CONFIG_PATH, scene_data)
+        
         # Update internal data
         self.scenes_data = scene_data
+        self.scenes_fingerprint = hash(json_dumps(scene_data))
+        self.scenes_edited = False
         
         # Send to backend
-        save_data = {
-            "type": "save_scenes", 
-            "scenes": scene_data
-        }
         backend_success = self.send_websocket_message("save_scenes", scenes=scene_data)
         
         if backend_success:
+            # Report success now; a failure reply from the backend rolls the status back
+            self.pending_save_replies += 1
             self.logger.info("Scene configuration saved locally and sent to backend")
-            self.update_status("Saved locally, waiting for backend...", primary)
+            self.update_status("Saved successfully", "ok")
+            self.schedule_scenes_updated()
         else:
-            QMessageBox.warning(self, "Warning", 
+            self.show_message(QMessageBox.Icon.Warning, "Warning",
                 "Scenes saved locally but could not sync to backend. "
                 "Backend will use local file on restart.")
-            self.update_status("Saved locally only", "orange")
+            self.update_status("Saved locally only", "warn")
             # Still emit signal since local save succeeded
-            self.scenes_updated.emit()
+            self.schedule_scenes_updated()
 
     def reload_scenes(self):
         """Public method to reload scenes (called by HomeScreen)"""
         self.request_scenes()
 
+    @error_boundary
+    def request_scenes(self):
+        """Request the scene list from the backend"""
+        if not self.send_websocket_text(GET_SCENES_MESSAGE):
+            self.logger.warning("Failed to request scenes from backend")
+
     @error_boundary
     def update_audio_files(self):
         """Update audio files in all existing rows"""
-        for row in self.scene_rows:
-            row.audio_files = self.audio_files
-            current_selection = row.audio_file_combo.currentText()
-            row.audio_file_combo.clear()
-            row.audio_file_combo.addItems(self.audio_files)
-            if current_selection in self.audio_files:
-                row.audio_file_combo.setCurrentText(current_selection)
-            elif self.audio_files:
-                row.audio_file_combo.setCurrentIndex(0)
+        files = self.audio_files
+        self.reap_dead_rows()
+        
+        # Refreshes usually return the same list; leave the model and combos alone then
+        snapshot = tuple(files)
+        if snapshot == self.audio_model_files:
+            return
+        self.audio_model_files = snapshot
+        # First occurrence wins, matching what findText would return
+        self.audio_file_index = {name: i for i, name in reversed(list(enumerate(files)))}
+        
+        open_rows = [row for row in self.scene_rows if row.details_widget is not None]
+        
+        # Every combo shares audio_model, so one reset repopulates them all
+        blockers = [QSignalBlocker(row.audio_file_combo) for row in open_rows]
+        self.scenes_container.setUpdatesEnabled(False)
+        try:
+            self.audio_model.setStringList(files)
+            for row in open_rows:
+                combo = row.audio_file_combo
+                index = self.audio_file_index.get(row.scene_data.get("audio_file", ""), -1)
+                if index >= 0:
+                    combo.setCurrentIndex(index)
+                elif files:
+                    combo.setCurrentIndex(0)
+                    row.update_state("audio_file", combo.currentText())
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+            self.scenes_container.setUpdatesEnabled(True)
+
+    def reap_dead_rows(self):
+        """Drop rows whose underlying Qt object has already been destroyed"""
+        if not any(sip.isdeleted(row) for row in self.scene_rows):
+            return
+        # Rows and scenes_data are kept index-aligned
+        live = [i for i, row in enumerate(self.scene_rows) if not sip.isdeleted(row)]
+        self.scene_rows = [self.scene_rows[i] for i in live]
+        self.scenes_data = [self.scenes_data[i] for i in live if i < len(self.scenes_data)]
+        self.logger.debug("Reaped destroyed scene rows")
 
     def get_scene_summary(self):
         """Get summary of current scene configuration"""
+        # Single pass over the scenes
+        categories = set()
+        audio_scenes = script_scenes = 0
+        for scene in self.scenes_data:
+            categories.update(scene.get("categories", ()))
+            audio_scenes += bool(scene.get("audio_enabled"))
+            script_scenes += bool(scene.get("script_enabled"))
+        
         return {
             "total_scenes": len(self.scenes_data),
-            "categories": list(set(cat for scene in self.scenes_data for cat in scene.get("categories", []))),
-            "audio_scenes": len([s for s in self.scenes_data if s.get("audio_enabled")]),
-            "script_scenes": len([s for s in self.scenes_data if s.get("script_enabled")])
+            "categories": list(categories),
+            "audio_scenes": audio_scenes,
+            "script_scenes": script_scenes
         }
\ No newline at end of file
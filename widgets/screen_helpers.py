@@ -0,0 +1,66 @@
+"""
+WALL-E Control System - Shared Screen Helpers
+Caches and helpers shared by more than one screen
+"""
+
+import json
+from string import Template
+
+from PyQt6.QtGui import QFont
+
+# Use a C JSON codec for backend messages when one is installed: orjson, then ujson
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ujson
+    UJSON_AVAILABLE = True
+except ImportError:
+    UJSON_AVAILABLE = False
+
+if ORJSON_AVAILABLE:
+    json_loads = orjson.loads
+elif UJSON_AVAILABLE:
+    json_loads = ujson.loads
+else:
+    json_loads = json.loads
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    if UJSON_AVAILABLE:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj).encode("utf-8")
+
+
+# Stylesheet templates live in resources/styles and are read from disk once
+QSS_TEMPLATES = {}
+
+
+def load_qss_template(path):
+    """Read a stylesheet template from disk once"""
+    template = QSS_TEMPLATES.get(path)
+    if template is None:
+        with open(path, "r", encoding="utf-8") as f:
+            template = Template(f.read())
+        QSS_TEMPLATES[path] = template
+    return template
+
+
+# Fonts are shared rather than rebuilt per widget; created lazily once a QApplication exists
+FONTS = {}
+
+
+def get_font(point_size, weight=QFont.Weight.Normal, family="Arial"):
+    """Return the shared QFont for the given family, size and weight"""
+    key = (family, point_size, weight)
+    font = FONTS.get(key)
+    if font is None:
+        font = QFont(family, point_size, weight)
+        FONTS[key] = font
+    return font
@@ -3,37 +3,73 @@ WALL-E Control System - Servo Configuration Screen (Themed)
 Real-time servo control and configuration interface with theme support
 """
 
-import json
+import logging
 import os
+import weakref
+from collections import deque
+from dataclasses import asdict
+from types import MappingProxyType
+from PyQt6 import sip
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, 
                             QScrollArea, QWidget, QFrame, QLineEdit, QSpinBox, QSlider,
                             QCheckBox, QButtonGroup)
 from PyQt6.QtGui import QFont, QIcon, QPainter, QPolygon, QColor
-from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QPoint 
+from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal, QPoint, QSignalBlocker
 
 from widgets.base_screen import BaseScreen
 from core.config_manager import config_manager
 from core.theme_manager import theme_manager
 from core.utils import error_boundary
 from core.logger import get_logger
-from typing import Dict, Any
+from widgets.screen_helpers import get_font, json_loads, load_qss_template
 
+# Shared read-only stand-in for channels with no saved configuration
+EMPTY_CHANNEL_CONFIG = MappingProxyType({})
 
-class HomePositionSlider(QSlider):
-    """Custom slider with diamond home position indicator"""
-    
-    def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
-        super().__init__(orientation, parent)
-        self.home_position = None
-        self._update_slider_style()
-        # Register for theme changes
-        theme_manager.register_callback(self._update_slider_style)
-    
-    def _update_slider_style(self):
-        """Apply themed styling to slider"""
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        self.setStyleSheet(f"""
+# Live slider drags send at most one move per channel per window
+SERVO_MOVE_THROTTLE_MS = 30
+
+# Edits arriving within this window are written to servo_config.json in one save
+CONFIG_SAVE_DELAY_MS = 300
+
+# Stylesheets are built once per (kind, theme) and shared by every widget of that kind
+STYLE_CACHE = {}
+STYLE_BUILDERS = {}
+
+# The control panel is styled by one template installed on the panel itself;
+# its children opt in via objectName or a "variant" property
+SERVO_PANEL_QSS_PATH = "resources/styles/servo_panel.qss"
+
+
+def style_builder(kind):
+    """Register a function that builds a widget kind's stylesheet from a ThemeSnapshot"""
+    def register(builder):
+        STYLE_BUILDERS[kind] = builder
+        return builder
+    return register
+
+
+def get_style(kind):
+    """Return the stylesheet for a widget kind in the current theme"""
+    key = (kind, theme_manager.get_theme_name())
+    style = STYLE_CACHE.get(key)
+    if style is None:
+        style = STYLE_BUILDERS[kind](theme_manager.snapshot())
+        STYLE_CACHE[key] = style
+    return style
+
+
+def set_style_if_changed(widget, style):
+    """Apply a stylesheet unless the widget already has it; setStyleSheet always repolishes"""
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+
+@style_builder("slider")
+def slider_style(theme):
+    primary = theme.primary
+    primary_light = theme.primary_light
+    return f"""
             QSlider {{
                 border: none;
                 background: transparent;
@@ -55,61 +91,472 @@ class HomePositionSlider(QSlider):
             QSlider::handle:horizontal:hover {{
                 background: {primary_light};
             }}
-        """)
+        """
+
+
+@style_builder("grid_widget")
+def grid_widget_style(theme):
+    return """
+            QWidget { 
+                border: none; 
+                border-radius: 12px; 
+                background: transparent;
+            }
+        """
+
+
+@style_builder("scroll_area")
+def scroll_area_style(theme):
+    primary = theme.primary
+    primary_light = theme.primary_light
+    return f"""
+        QScrollArea {{
+            border: none;
+            background-color: transparent;
+        }}
+        QScrollBar:vertical {{
+            background: #2d2d2d;
+            width: 12px;
+            border-radius: 6px;
+        }}
+        QScrollBar::handle:vertical {{
+            background: {primary};
+            border-radius: 6px;
+            min-height: 20px;
+        }}
+        QScrollBar::handle:vertical:hover {{
+            background: {primary_light};
+        }}
+        """
+
+
+@style_builder("status_label")
+def status_label_style(theme):
+    return f"color: {theme.primary}; padding: 3px;"
+
+
+@style_builder("status_ok")
+def status_ok_style(theme):
+    return f"color: {theme.green}; padding: 3px;"
+
+
+@style_builder("status_error")
+def status_error_style(theme):
+    return f"color: {theme.red}; padding: 3px;"
+
+
+# Position/sweep readouts recolor on every update, so their sheets are cached too
+@style_builder("readout_primary")
+def readout_primary_style(theme):
+    return f"color: {theme.primary}; background: transparent;"
+
+
+@style_builder("readout_primary_light")
+def readout_primary_light_style(theme):
+    return f"color: {theme.primary_light}; background: transparent;"
+
+
+@style_builder("readout_green")
+def readout_green_style(theme):
+    return f"color: {theme.green}; background: transparent;"
+
+
+@style_builder("readout_red")
+def readout_red_style(theme):
+    return f"color: {theme.red}; background: transparent;"
+
+
+@style_builder("control_panel")
+def control_panel_style(theme):
+    return load_qss_template(SERVO_PANEL_QSS_PATH).substitute(asdict(theme))
+
+
+@style_builder("operation_button")
+def operation_button_style(theme):
+    primary = theme.primary
+    return f"""
+            QPushButton {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #4a4a4a, stop:1 #2a2a2a);
+                color: white;
+                border: 1px solid #666;
+                border-radius: 6px;
+                padding: 6px;
+                text-align: center;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #5a5a5a, stop:1 #3a3a3a);
+                border-color: {primary};
+            }}
+            QPushButton:pressed {{
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #3a3a3a, stop:1 #1a1a1a);
+                border-color: {primary};
+            }}
+        """
+
+
+@style_builder("nema_frame")
+def nema_frame_style(theme):
+    primary = theme.primary
+    return f"""
+            QFrame {{
+                border: 1px solid {primary};
+                border-radius: 12px;
+                background-color: rgba(0, 0, 0, 0.1);
+            }}
+        """
+
+
+@style_builder("nema_header")
+def nema_header_style(theme):
+    return f"color: {theme.primary}; background: transparent;"
+
+
+@style_builder("nema_position_display")
+def nema_position_display_style(theme):
+    primary = theme.primary
+    return f"""
+            QLabel {{
+                color: {primary};
+                border: 2px solid {primary};
+                border-radius: 10px;
+                padding: 20px;
+                background-color: rgba(0, 0, 0, 0.3);
+            }}
+        """
+
+
+@style_builder("input")
+def input_style(theme):
+    primary = theme.primary
+    return f"""
+        QLineEdit {{
+            background-color: #2d2d2d;
+            border: 1px solid #555;
+            border-radius: 4px;
+            padding: 6px;
+            color: white;
+        }}
+        QLineEdit:focus {{ 
+            border-color: {primary}; 
+            background-color: #333333;
+        }}
+        """
+
+
+@style_builder("spinbox")
+def spinbox_style(theme):
+    primary = theme.primary
+    return f"""
+        QSpinBox {{
+            background-color: #2d2d2d;
+            border: 1px solid #555;
+            border-radius: 4px;
+            padding: 6px;
+            color: white;
+        }}
+        QSpinBox:focus {{ 
+            border-color: {primary}; 
+            background-color: #333333;
+        }}
+        """
+
+
+@style_builder("checkbox")
+def checkbox_style(theme):
+    green = theme.green
+    return f"""
+            QCheckBox::indicator {{
+                width: 16px;
+                height: 16px;
+            }}
+            QCheckBox::indicator:unchecked {{
+                background-color: #333;
+                border: 1px solid #666;
+                border-radius: 2px;
+            }}
+            QCheckBox::indicator:checked {{
+                background-color: {green};
+                border: 1px solid {green};
+                border-radius: 2px;
+            }}
+        """
+
+
+@style_builder("play_button")
+def play_button_style(theme):
+    red = theme.red
+    return f"""
+            QPushButton {{
+                border: none;
+                background-color: #444;
+                color: white;
+                border-radius: 4px;
+            }}
+            QPushButton:hover {{
+                background-color: #555;
+            }}
+            QPushButton:pressed {{
+                background-color: #333;
+            }}
+            QPushButton:checked {{
+                background-color: {red};
+                color: white;
+            }}
+        """
+
+
+class HomePositionSlider(QSlider):
+    """Custom slider with diamond home position indicator"""
+    
+    # Diamond centred on the origin; paintEvent translates it onto the home position
+    HOME_DIAMOND = QPolygon([
+        QPoint(0, -4),      # Top
+        QPoint(4, 0),       # Right
+        QPoint(0, 4),       # Bottom
+        QPoint(-4, 0)       # Left
+    ])
+    
+    # Groove geometry: starts past the handle's half width and ends 24px short of the right edge
+    GROOVE_LEFT = 8
+    GROOVE_MARGIN = 24
+    
+    # Live sliders, restyled together by a single theme callback; entries drop out
+    # when the Python wrapper is collected, and restyle_all skips deleted C++ objects
+    instances = weakref.WeakSet()
+    theme_callback_registered = False
+    
+    def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
+        super().__init__(orientation, parent)
+        self.home_position = None
+        self.home_ratio = None  # Home position as a fraction of the range; None hides the diamond
+        self.home_color_name = None  # Theme color the cached QColor was built from
+        self.home_color = None
+        self.rangeChanged.connect(self.update_home_ratio)
+        self._update_slider_style()
+        
+        # Register for theme changes once for the whole class
+        HomePositionSlider.instances.add(self)
+        if not HomePositionSlider.theme_callback_registered:
+            theme_manager.register_callback(HomePositionSlider.restyle_all)
+            HomePositionSlider.theme_callback_registered = True
+    
+    @classmethod
+    def restyle_all(cls):
+        """Apply the current theme's slider stylesheet to every live slider"""
+        style = get_style("slider")
+        for slider in list(cls.instances):
+            if not sip.isdeleted(slider):
+                slider.setStyleSheet(style)
+    
+    def _update_slider_style(self):
+        """Apply themed styling to slider"""
+        self.setStyleSheet(get_style("slider"))
     
     def set_home_position(self, position):
         """Set the home position for visual indication"""
         self.home_position = position
+        self.update_home_ratio()
+    
+    def update_home_ratio(self, *_):
+        """Recompute where the home diamond sits after the home position or range changes"""
+        slider_range = self.maximum() - self.minimum()
+        if self.home_position is None or slider_range <= 0:
+            self.home_ratio = None
+        else:
+            self.home_ratio = (self.home_position - self.minimum()) / slider_range
         self.update()
     
     def paintEvent(self, event):
         """Custom paint event to draw home position diamond"""
         super().paintEvent(event)
         
-        if self.home_position is None:
+        # Idle repaints of sliders without a home position stop here
+        if self.home_ratio is None:
             return
         
+        # Calculate diamond position on the groove
+        groove_width = self.width() - self.GROOVE_MARGIN
+        diamond_x = self.GROOVE_LEFT + int(self.home_ratio * groove_width)
+        diamond_y = (self.height() - 1) // 2 - 1
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Calculate home position on slider
-        slider_range = self.maximum() - self.minimum()
-        if slider_range <= 0:
-            return
-            
-        home_ratio = (self.home_position - self.minimum()) / slider_range
-        
-        # Get slider groove rectangle
-        groove_rect = self.rect()
-        groove_rect.setY(groove_rect.center().y() - 3)
-        groove_rect.setHeight(6)
-        groove_rect.setX(groove_rect.x() + 8)  # Account for handle width
-        groove_rect.setWidth(groove_rect.width() - 16)
-        
-        # Calculate diamond position
-        diamond_x = groove_rect.x() + int(home_ratio * groove_rect.width())
-        diamond_y = groove_rect.center().y()
-        
-        # Draw diamond with theme color
-        diamond_size = 4
-        diamond = QPolygon([
-            QPoint(diamond_x, diamond_y - diamond_size),      # Top
-            QPoint(diamond_x + diamond_size, diamond_y),      # Right
-            QPoint(diamond_x, diamond_y + diamond_size),      # Bottom
-            QPoint(diamond_x - diamond_size, diamond_y)       # Left
-        ])
-        
-        # Use theme primary color for home indicator
+        # Use theme primary color for home indicator, rebuilding the QColor only when it changes
         home_color = theme_manager.get("primary_color", "#FFD700")
-        painter.setBrush(QColor(home_color))
-        painter.setPen(QColor(home_color))
-        painter.drawPolygon(diamond)
+        if home_color != self.home_color_name:
+            self.home_color_name = home_color
+            self.home_color = QColor(home_color)
+        painter.setBrush(self.home_color)
+        painter.setPen(self.home_color)
+        
+        # Draw the shared diamond at the home position
+        painter.translate(diamond_x, diamond_y)
+        painter.drawPolygon(self.HOME_DIAMOND)
+
+class ServoChannelRow:
+    """Widgets for one servo channel in the grid, rebound to a channel rather than rebuilt"""
+    
+    def __init__(self, screen, row: int):
+        self.screen = screen
+        self.channel_key = None
+        layout = screen.grid_layout
+        
+        # Channel number
+        self.label = QLabel()
+        self.label.setFont(get_font(14))
+        self.label.setFixedWidth(35)
+        layout.addWidget(self.label, row, 0)
+        
+        # Name edit
+        self.name_edit = QLineEdit()
+        self.name_edit.setFont(get_font(16))
+        self.name_edit.setMaxLength(25)
+        self.name_edit.setFixedWidth(140)
+        self.name_edit.setPlaceholderText("Servo Name")
+        self.name_edit.textChanged.connect(self.on_name_changed)
+        layout.addWidget(self.name_edit, row, 1)
+        
+        # Slider for position control with custom styling and home indicator
+        self.slider = HomePositionSlider(Qt.Orientation.Horizontal)
+        self.slider.setFixedWidth(140)
+        self.slider.setMinimumHeight(24)
+        self.slider.valueChanged.connect(self.on_slider_moved)
+        layout.addWidget(self.slider, row, 2)
+        
+        # Min/Max value controls
+        self.min_spin = QSpinBox()
+        self.min_spin.setFont(get_font(16))
+        self.min_spin.setRange(0, 2500)
+        self.min_spin.setFixedWidth(75)
+        self.min_spin.valueChanged.connect(self.on_min_changed)
+        layout.addWidget(self.min_spin, row, 3)
+        
+        self.max_spin = QSpinBox()
+        self.max_spin.setFont(get_font(16))
+        self.max_spin.setRange(0, 2500)
+        self.max_spin.setFixedWidth(75)
+        self.max_spin.valueChanged.connect(self.on_max_changed)
+        layout.addWidget(self.max_spin, row, 4)
+        
+        # Speed/Acceleration controls
+        self.speed_spin = QSpinBox()
+        self.speed_spin.setFont(get_font(16))
+        self.speed_spin.setRange(0, 100)
+        self.speed_spin.setFixedWidth(60)
+        self.speed_spin.valueChanged.connect(self.on_speed_changed)
+        layout.addWidget(self.speed_spin, row, 5)
+        
+        self.accel_spin = QSpinBox()
+        self.accel_spin.setFont(get_font(16))
+        self.accel_spin.setRange(0, 100)
+        self.accel_spin.setFixedWidth(60)
+        self.accel_spin.valueChanged.connect(self.on_accel_changed)
+        layout.addWidget(self.accel_spin, row, 6)
+        
+        # Position label
+        self.pos_label = QLabel()
+        self.pos_label.setFont(get_font(16))
+        self.pos_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pos_label.setFixedWidth(60)
+        layout.addWidget(self.pos_label, row, 7)
+        
+        # Live update checkbox
+        self.live_checkbox = QCheckBox()
+        self.live_checkbox.setToolTip("Enable live servo updates")
+        self.live_checkbox.setFixedSize(20, 20)
+        layout.addWidget(self.live_checkbox, row, 8)
+        
+        # Play/sweep button with themed styling
+        self.play_btn = QPushButton()
+        self.play_btn.setFont(get_font(12))
+        self.play_btn.setCheckable(True)
+        self.play_btn.setFixedSize(30, 30)
+        self.play_btn.clicked.connect(self.on_play_clicked)
+        layout.addWidget(self.play_btn, row, 9)
+        
+        self.widgets = (self.label, self.name_edit, self.slider, self.min_spin, self.max_spin,
+                        self.speed_spin, self.accel_spin, self.pos_label, self.live_checkbox, self.play_btn)
+        self.apply_theme()
+    
+    def bind(self, channel_key: str, channel: int, config: dict):
+        """Show the given channel's configuration without emitting change signals"""
+        self.channel_key = channel_key
+        min_val = config.get("min", 992)
+        max_val = config.get("max", 2000)
+        
+        with QSignalBlocker(self.name_edit), QSignalBlocker(self.slider), \
+                QSignalBlocker(self.min_spin), QSignalBlocker(self.max_spin), \
+                QSignalBlocker(self.speed_spin), QSignalBlocker(self.accel_spin), \
+                QSignalBlocker(self.play_btn):
+            self.label.setText(f"Ch{channel}")
+            self.name_edit.setText(config.get("name", ""))
+            self.slider.setRange(min_val, max_val)
+            self.slider.setValue((min_val + max_val) // 2)
+            self.min_spin.setValue(min_val)
+            self.max_spin.setValue(max_val)
+            self.speed_spin.setValue(config.get("speed", 0))
+            self.accel_spin.setValue(config.get("accel", 0))
+            self.play_btn.setChecked(False)
+        self.live_checkbox.setChecked(False)
+        
+        # Set home position indicator, clearing one left over from the previous channel
+        self.slider.set_home_position(config.get("home"))
+        
+        self.play_btn.setText("▶️")
+        self.pos_label.setText("---")
+        set_style_if_changed(self.pos_label, get_style("readout_primary"))
+    
+    def set_visible(self, visible: bool):
+        """Show or hide every widget in the row"""
+        for widget in self.widgets:
+            widget.setVisible(visible)
+    
+    def apply_theme(self):
+        """Apply the current theme to the row's widgets"""
+        screen = self.screen
+        self.label.setStyleSheet("color: white; background: transparent;")
+        self.pos_label.setStyleSheet("color: white; background: transparent;")
+        screen._update_input_style(self.name_edit)
+        for spin in (self.min_spin, self.max_spin, self.speed_spin, self.accel_spin):
+            screen._update_spinbox_style(spin)
+        screen._update_checkbox_style(self.live_checkbox)
+        screen._update_play_button_style(self.play_btn)
+    
+    def on_name_changed(self, text):
+        self.screen.update_config(self.channel_key, "name", text)
+    
+    def on_min_changed(self, value):
+        self.screen.update_config(self.channel_key, "min", value)
+        self.slider.setMinimum(value)
+    
+    def on_max_changed(self, value):
+        self.screen.update_config(self.channel_key, "max", value)
+        self.slider.setMaximum(value)
+    
+    def on_speed_changed(self, value):
+        self.screen.update_servo_speed_config(self.channel_key, value)
+    
+    def on_accel_changed(self, value):
+        self.screen.update_servo_accel_config(self.channel_key, value)
+    
+    def on_slider_moved(self, value):
+        self.screen.update_servo_position_conditionally(self.channel_key, self.pos_label, value, self.live_checkbox)
+    
+    def on_play_clicked(self, checked):
+        self.screen.toggle_sweep_minmax(self.channel_key, self.pos_label, self.play_btn,
+                                        self.min_spin.value(), self.max_spin.value(), self.speed_spin.value())
+
 
 class ServoConfigScreen(BaseScreen):
     """Real-time servo control and configuration interface"""
     
     # Qt signals for thread-safe communication
-    position_update_signal = pyqtSignal(str, int)
+    positions_queued_signal = pyqtSignal()  # Wakes the UI to drain position_queue
     status_update_signal = pyqtSignal(str, bool, bool)
     
     def __init__(self, websocket=None):
@@ -124,17 +571,28 @@ class ServoConfigScreen(BaseScreen):
         if websocket:
             websocket.textMessageReceived.connect(self.handle_message)
 
-        # Register for theme change notifications
-        theme_manager.register_callback(self._on_theme_changed)
+        # Theme notifications arriving in one event loop pass restyle the screen once
+        self.theme_refresh_timer = QTimer(self)
+        self.theme_refresh_timer.setSingleShot(True)
+        self.theme_refresh_timer.setInterval(0)
+        self.theme_refresh_timer.timeout.connect(self._refresh_theme)
         
-        # Add WebSocket connection monitoring
-        self.ws_connection_timer = QTimer()
-        self.ws_connection_timer.timeout.connect(self.check_websocket_and_detect)
-        self.ws_connection_timer.start(2000)  # Check every 2 seconds
+        # Register for theme change notifications; Qt's destroyed signal fires
+        # exactly once, unlike __del__, which the registered callback would block anyway
+        theme_manager.register_callback(self._on_theme_changed)
+        self.destroyed.connect(
+            lambda _=None, cb=self._on_theme_changed: theme_manager.unregister_callback(cb))
         
         # Track if we've done initial detection
         self.initial_detection_done = False
         
+        # Follow the WebSocket's own connection signals rather than polling its state
+        if websocket:
+            websocket.connected.connect(self.on_websocket_connected)
+            websocket.disconnected.connect(self.on_websocket_disconnected)
+            if websocket.is_connected():
+                QTimer.singleShot(0, self.on_websocket_connected)
+        
         # Call existing init
         
     @error_boundary
@@ -148,13 +606,6 @@ class ServoConfigScreen(BaseScreen):
             return {}
         
     
-    def __del__(self):
-        """Clean up theme manager callback on destruction"""
-        try:
-            theme_manager.unregister_callback(self._on_theme_changed)
-        except Exception:
-            pass
-    
     def _setup_screen(self):
         """Initialize servo configuration screen"""
         self.logger = get_logger("servo_screen")
@@ -190,7 +641,38 @@ class ServoConfigScreen(BaseScreen):
                     self.nema_config[key] = value
 
         # Widget tracking for position updates
-        self.servo_widgets = {}
+        # Parallel per-row lists for the shown maestro (index = channel) plus a key lookup
+        self.row_channel_keys = []
+        self.row_sliders = []
+        self.row_position_labels = []
+        self.row_play_buttons = []
+        self.row_live_checkboxes = []
+        self.channel_to_row = {}
+        
+        # Channel rows are built once and rebound on every grid update; update_grid grows the pool
+        self.row_pool = []
+        self.pooled_widgets = set()
+        
+        # Other grid widgets restyled on theme change, tracked as they are created
+        self.themed_spinboxes = []
+        self.themed_labels = []
+        
+        # Speed/acceleration the backend last acknowledged per channel; it keeps
+        # them between moves, so they only need resending when they change
+        self.sent_motion_settings = {}
+        
+        # Latest dragged value per live channel, sent when the throttle timer fires
+        self.pending_servo_moves = {}
+        self.servo_move_timer = QTimer(self)
+        self.servo_move_timer.setSingleShot(True)
+        self.servo_move_timer.setInterval(SERVO_MOVE_THROTTLE_MS)
+        self.servo_move_timer.timeout.connect(self.flush_servo_moves)
+        
+        # Channel edits mark the config dirty; one save runs once they settle
+        self.config_save_timer = QTimer(self)
+        self.config_save_timer.setSingleShot(True)
+        self.config_save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+        self.config_save_timer.timeout.connect(self.save_config)
         
         # Position update management
         self.position_update_timer_auto = QTimer()
@@ -203,9 +685,32 @@ class ServoConfigScreen(BaseScreen):
         self.position_read_timeout.timeout.connect(self.handle_position_read_timeout)
         self.position_read_timeout.setSingleShot(True)
         
-        # Connect Qt signals for thread safety
-        self.position_update_signal.connect(self.update_servo_position_display)
-        self.status_update_signal.connect(self.update_status_threadsafe)
+        # Message type -> handler; NEMA handlers always run so their state stays
+        # current, and only touch NEMA widgets while that interface is shown
+        # Telemetry is handled by other screens and has no entry here
+        self.message_handlers = {
+            "maestro_info": self.handle_maestro_info,
+            "servo_position": self.handle_servo_position,
+            "all_servo_positions": self.handle_all_servo_positions,
+            "nema_position_update": self.handle_nema_position_update,
+            "nema_sweep_status": self.handle_nema_sweep_status,
+            "nema_homing_complete": self.handle_nema_homing_complete,
+            "nema_status": self.handle_nema_status_update,
+            "nema_error": self.handle_nema_error,
+            "nema_enable_response": self.handle_nema_enable_response
+        }
+        
+        # Frames that contain none of the handled types are dropped before parsing;
+        # built from the table so the prefilter and the dispatch cannot disagree
+        self.message_type_markers = tuple(f'"{msg_type}"' for msg_type in self.message_handlers)
+        
+        # Position updates are queued and applied in one pass per event loop wake-up
+        self.position_queue = deque()
+        
+        # Connect Qt signals for thread safety; queued explicitly so a burst of
+        # updates drains once and emits skip the per-call thread check
+        self.positions_queued_signal.connect(self.drain_position_queue, Qt.ConnectionType.QueuedConnection)
+        self.status_update_signal.connect(self.update_status_threadsafe, Qt.ConnectionType.QueuedConnection)
         
         self.setup_layout()
         
@@ -218,38 +723,19 @@ class ServoConfigScreen(BaseScreen):
     
     def handle_message(self, message: str):
         """Enhanced message handler to support NEMA WebSocket messages"""
+        if not any(marker in message for marker in self.message_type_markers):
+            return
         try:
-            msg = json.loads(message)
-            msg_type = msg.get("type")
-            
-            # Handle existing message types first
-            if msg_type == "telemetry":
-                self.handle_telemetry(msg)
-            elif msg_type == "maestro_info":
-                self.handle_maestro_info(msg)
-            elif msg_type == "servo_position":
-                self.handle_servo_position(msg)
-            elif msg_type == "all_servo_positions":
-                self.handle_all_servo_positions(msg)
-                
-            # ========================================
-            # NEW NEMA MESSAGE HANDLERS
-            # ========================================
-            elif msg_type == "nema_position_update":
-                self.handle_nema_position_update(msg)
-            elif msg_type == "nema_sweep_status":
-                self.handle_nema_sweep_status(msg)
-            elif msg_type == "nema_homing_complete":
-                self.handle_nema_homing_complete(msg)
-            elif msg_type == "nema_status":
-                self.handle_nema_status_update(msg)
-            elif msg_type == "nema_error":
-                self.handle_nema_error(msg)
-            elif msg_type == "nema_enable_response":
-                self.handle_nema_enable_response(msg)
-                
-        except json.JSONDecodeError as e:
+            msg = json_loads(message)
+        except ValueError as e:
+            # Every codec's decode error is a ValueError
             self.logger.error(f"Failed to parse WebSocket message: {e}")
+            return
+        try:
+            msg_type = msg.get("type")
+            handler = self.message_handlers.get(msg_type)
+            if handler:
+                handler(msg)
         except Exception as e:
             self.logger.error(f"Error handling message: {e}")
 
@@ -271,7 +757,8 @@ class ServoConfigScreen(BaseScreen):
                 # Update position display
                 self.position_display.setText(f"{position_cm:.1f} cm")
                 
-            self.logger.debug(f"NEMA position updated: {position_cm:.1f} cm")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"NEMA position updated: {position_cm:.1f} cm")
             
         except Exception as e:
             self.logger.error(f"Error handling NEMA position update: {e}")
@@ -300,33 +787,7 @@ class ServoConfigScreen(BaseScreen):
         except Exception as e:
             self.logger.error(f"Error handling NEMA sweep status: {e}")
 
-    def handle_telemetry(self, msg):
-        """Handle telemetry messages - placeholder for now"""
-        # You can implement telemetry handling here if needed
-        # For now, just log that we received it
-        self.logger.debug("Received telemetry message")
-        pass
-
     # You may also need these if they don't exist:
-    def handle_servo_position(self, data):
-        """Handle servo position messages"""
-        channel_key = data.get("channel")
-        position = data.get("position")
-        
-        if channel_key and position is not None:
-            self.position_update_signal.emit(channel_key, position)
-            
-            # Notify active sweeps
-            if channel_key in self.active_sweeps:
-                try:
-                    self.active_sweeps[channel_key].position_reached(position)
-                except Exception as e:
-                    self.logger.error(f"Error updating sweep position for {channel_key}: {e}")
-                    if channel_key in self.active_sweeps:
-                        self.active_sweeps[channel_key].stop()
-                        del self.active_sweeps[channel_key]
-
-
     def handle_nema_homing_complete(self, msg):
         """Handle homing completion notification"""
         try:
@@ -362,7 +823,7 @@ class ServoConfigScreen(BaseScreen):
             self.nema_config["current_position"] = position_cm
             
             # Update enable button to match hardware state
-            if hasattr(self, 'enable_btn'):
+            if self.current_controller == 2 and hasattr(self, 'enable_btn'):
                 self.enable_btn.blockSignals(True)
                 self.enable_btn.setChecked(hardware_enabled)
                 if hardware_enabled:
@@ -398,7 +859,7 @@ class ServoConfigScreen(BaseScreen):
             status_text = f"NEMA: {', '.join(status_parts)}"
             
             # Update status display
-            if hasattr(self, 'nema_status_label'):
+            if self.current_controller == 2 and hasattr(self, 'nema_status_label'):
                 self.nema_status_label.setText(status_text)
                 self.nema_status_label.setStyleSheet(f"color: {color}; font-weight: bold; background: transparent;")
             
@@ -429,7 +890,7 @@ class ServoConfigScreen(BaseScreen):
                 self.logger.info(f"NEMA stepper {action} successfully")
                 
                 # Update button state to match response
-                if hasattr(self, 'enable_btn'):
+                if self.current_controller == 2 and hasattr(self, 'enable_btn'):
                     self.enable_btn.blockSignals(True)
                     self.enable_btn.setChecked(enabled)
                     if enabled:
@@ -442,7 +903,7 @@ class ServoConfigScreen(BaseScreen):
                 self.logger.error(f"NEMA enable command failed: {message}")
                 
                 # Reset button to previous state on failure
-                if hasattr(self, 'enable_btn'):
+                if self.current_controller == 2 and hasattr(self, 'enable_btn'):
                     self.enable_btn.blockSignals(True)
                     self.enable_btn.setChecked(not enabled)
                     self.enable_btn.blockSignals(False)
@@ -467,7 +928,7 @@ class ServoConfigScreen(BaseScreen):
             # Stop any active sweep on error
             if hasattr(self, 'nema_test_sweeping') and self.nema_test_sweeping:
                 self.nema_test_sweeping = False
-                if hasattr(self, 'test_sweep_btn'):
+                if self.current_controller == 2 and hasattr(self, 'test_sweep_btn'):
                     self.test_sweep_btn.setText("▶️ TEST SWEEP")
                     self.test_sweep_btn.setChecked(False)
                     
@@ -510,17 +971,17 @@ class ServoConfigScreen(BaseScreen):
         position = data.get("position")
         
         if channel_key and position is not None:
-            self.position_update_signal.emit(channel_key, position)
+            self.queue_position_update(channel_key, position)
             
             # Notify active sweeps
-            if channel_key in self.active_sweeps:
+            sweep = self.active_sweeps.get(channel_key)
+            if sweep is not None:
                 try:
-                    self.active_sweeps[channel_key].position_reached(position)
+                    sweep.position_reached(position)
                 except Exception as e:
                     self.logger.error(f"Error updating sweep position for {channel_key}: {e}")
-                    if channel_key in self.active_sweeps:
-                        self.active_sweeps[channel_key].stop()
-                        del self.active_sweeps[channel_key]
+                    self.active_sweeps.pop(channel_key, None)
+                    sweep.stop()
 
     def handle_all_servo_positions(self, data):
         """Handle all servo positions messages"""
@@ -538,7 +999,7 @@ class ServoConfigScreen(BaseScreen):
             for channel, position in positions.items():
                 channel_key = f"m{maestro_num}_ch{channel}"
                 if position is not None:
-                    self.position_update_signal.emit(channel_key, position)
+                    self.queue_position_update(channel_key, position)
             
             if len(positions) > 0:
                 self.update_status(f"Read {len(positions)} positions from Maestro {maestro_num}")
@@ -825,13 +1286,14 @@ class ServoConfigScreen(BaseScreen):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setWidget(self.grid_widget)
         self._update_scroll_area_style(scroll_area)
+        self.scroll_area = scroll_area
         
         # Create themed control panel
         control_panel = self._create_control_panel()
         
         # Status label
         self.status_label = QLabel("Initializing...")
-        self.status_label.setFont(QFont("Arial", 12))
+        self.status_label.setFont(get_font(12))
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.status_label.setFixedWidth(1050)
         self._update_status_label_style()
@@ -854,48 +1316,21 @@ class ServoConfigScreen(BaseScreen):
 
     def _update_grid_widget_style(self):
         """Apply themed styling to grid widget"""
-        primary = theme_manager.get("primary_color")
-        self.grid_widget.setStyleSheet(f"""
-            QWidget {{ 
-                border: none; 
-                border-radius: 12px; 
-                background: transparent;
-            }}
-        """)
+        self.grid_widget.setStyleSheet(get_style("grid_widget"))
 
     def _update_scroll_area_style(self, scroll_area):
         """Apply themed styling to scroll area"""
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        scroll_area.setStyleSheet(f"""
-        QScrollArea {{
-            border: none;
-            background-color: transparent;
-        }}
-        QScrollBar:vertical {{
-            background: #2d2d2d;
-            width: 12px;
-            border-radius: 6px;
-        }}
-        QScrollBar::handle:vertical {{
-            background: {primary};
-            border-radius: 6px;
-            min-height: 20px;
-        }}
-        QScrollBar::handle:vertical:hover {{
-            background: {primary_light};
-        }}
-        """)
+        scroll_area.setStyleSheet(get_style("scroll_area"))
 
     def _update_status_label_style(self):
         """Update status label with theme colors"""
-        primary = theme_manager.get("primary_color")
-        self.status_label.setStyleSheet(f"color: {primary}; padding: 3px;")
+        self.status_label.setStyleSheet(get_style("status_label"))
 
     def _create_control_panel(self):
         """Create the themed servo control panel"""
         # Main panel with theme styling
         control_panel = QWidget()
+        control_panel.setObjectName("servoControlPanel")
         control_panel.setFixedWidth(240)
         self._update_control_panel_style(control_panel)
         
@@ -905,9 +1340,9 @@ class ServoConfigScreen(BaseScreen):
         
         # Header with theme styling
         self.header = QLabel("SERVO CONTROL")
-        self.header.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.header.setFont(get_font(18, QFont.Weight.Bold))
         self.header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._update_header_style()
+        self.header.setObjectName("servoPanelHeader")
         panel_layout.addWidget(self.header)
         
         # Maestro selection with theme buttons
@@ -926,31 +1361,7 @@ class ServoConfigScreen(BaseScreen):
 
     def _update_control_panel_style(self, panel):
         """Apply themed styling to control panel"""
-        primary = theme_manager.get("primary_color")
-        panel_bg = theme_manager.get("panel_bg")
-        panel.setStyleSheet(f"""
-            QWidget {{
-                background-color: {panel_bg};
-                border: 2px solid {primary};
-                border-radius: 12px;
-                color: white;
-            }}
-        """)
-
-    def _update_header_style(self):
-        """Apply themed styling to header"""
-        primary = theme_manager.get("primary_color")
-        panel_bg = theme_manager.get("panel_bg")
-        self.header.setStyleSheet(f"""
-            QLabel {{
-                border: none;
-                background-color: rgba(0, 0, 0, 0.9);
-                color: {primary};
-                padding: 8px;
-                border-radius: 6px;
-                margin-bottom: 5px;
-            }}
-        """)
+        panel.setStyleSheet(get_style("control_panel"))
 
     def _create_maestro_section(self):
         """Create themed Maestro selection buttons"""
@@ -959,9 +1370,9 @@ class ServoConfigScreen(BaseScreen):
         
         # Maestro label
         self.maestro_label = QLabel("Controller")
-        self.maestro_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.maestro_label.setFont(get_font(16, QFont.Weight.Bold))
         self.maestro_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._update_maestro_label_style()
+        self.maestro_label.setObjectName("maestroLabel")
         maestro_layout.addWidget(self.maestro_label)
         
         # Button container
@@ -982,8 +1393,8 @@ class ServoConfigScreen(BaseScreen):
         self.nema_btn.setChecked(False)
         self.nema_btn.setFixedHeight(40)
         self.nema_btn.setFixedWidth(185)
-        self.nema_btn.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        self._update_maestro_button_style(self.nema_btn)
+        self.nema_btn.setFont(get_font(16, QFont.Weight.Bold))
+        self.nema_btn.setProperty("variant", "maestro")
         maestro_layout.addWidget(self.nema_btn)
         maestro_layout.setAlignment(self.nema_btn, Qt.AlignmentFlag.AlignCenter)
 
@@ -997,63 +1408,20 @@ class ServoConfigScreen(BaseScreen):
         
         return maestro_layout
 
-    def _update_maestro_label_style(self):
-        """Apply themed styling to maestro label"""
-        primary = theme_manager.get("primary_color")
-        self.maestro_label.setStyleSheet(f"color: {primary}; border: none; background: transparent;")
-
     def _create_maestro_button(self, number: str, is_selected: bool):
         """Create a themed Maestro selection button"""
         btn = QPushButton(f"M{number}")
         btn.setCheckable(True)
         btn.setChecked(is_selected)
         btn.setFixedSize(80, 60)
-        btn.setFont(QFont("Arial", 20, QFont.Weight.Bold))
-        self._update_maestro_button_style(btn)
+        btn.setFont(get_font(20, QFont.Weight.Bold))
+        btn.setProperty("variant", "maestro")
         return btn
 
-    def _update_maestro_button_style(self, btn):
-        """Apply themed styling to maestro button"""
-        primary = theme_manager.get("primary_color")
-        primary_light = theme_manager.get("primary_light")
-        primary_gradient = theme_manager.get("primary_gradient")
-        
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a4a4a, stop:1 #2a2a2a);
-                border: 2px solid #666;
-                border-radius: 8px;
-                color: #ccc;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a5a5a, stop:1 #3a3a3a);
-                border: 2px solid {primary};
-                color: {primary};
-            }}
-            QPushButton:checked {{
-                background: {primary_gradient};
-                border: 2px solid {primary};
-                color: black;
-                font-weight: bold;
-            }}
-            QPushButton:checked:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {primary_light}, stop:1 {primary});
-                border: 2px solid {primary_light};
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a3a3a, stop:1 #1a1a1a);
-            }}
-        """)
-
     def _create_operations_section(self):
         """Create the operations section with themed styling"""
         self.operations_frame = QWidget()
-        self._update_operations_frame_style(self.operations_frame)
+        self.operations_frame.setObjectName("operationsFrame")
 
         ops_layout = QVBoxLayout()
         ops_layout.setContentsMargins(15, 10, 15, 15)
@@ -1061,9 +1429,9 @@ class ServoConfigScreen(BaseScreen):
         
         # Operations header
         self.ops_header = QLabel("OPERATIONS")
-        self.ops_header.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        self.ops_header.setFont(get_font(16, QFont.Weight.Bold))
         self.ops_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._update_ops_header_style()
+        self.ops_header.setObjectName("opsHeader")
         ops_layout.addWidget(self.ops_header)
         
         # Create operation buttons
@@ -1078,57 +1446,19 @@ class ServoConfigScreen(BaseScreen):
         self.operation_buttons = []
         for text, callback, tooltip in button_configs:
             btn = QPushButton(text)
-            btn.setFont(QFont("Arial", 14))  
+            btn.setFont(get_font(14))  
             btn.setToolTip(tooltip)
             btn.clicked.connect(callback)
-            self._update_operation_button_style(btn)
+            btn.setProperty("variant", "operation")
             ops_layout.addWidget(btn)
             self.operation_buttons.append(btn)
         
         self.operations_frame.setLayout(ops_layout)
         return self.operations_frame
 
-    def _update_operations_frame_style(self, frame):
-        """Apply themed styling to operations frame"""
-        primary = theme_manager.get("primary_color")
-        frame.setStyleSheet(f"""
-            QWidget {{
-                border: 1px solid {primary};
-                border-radius: 8px;
-                background-color: rgba(0, 0, 0, 0.3);
-            }}
-        """)
-
-    def _update_ops_header_style(self):
-        """Apply themed styling to operations header"""
-        primary = theme_manager.get("primary_color")
-        self.ops_header.setStyleSheet(f"color: {primary}; border: none; margin-bottom: 5px; background: transparent;")
-
     def _update_operation_button_style(self, btn):
-        """Apply themed styling to operation button"""
-        primary = theme_manager.get("primary_color")
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a4a4a, stop:1 #2a2a2a);
-                color: white;
-                border: 1px solid #666;
-                border-radius: 6px;
-                padding: 6px;
-                text-align: center;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5a5a5a, stop:1 #3a3a3a);
-                border-color: {primary};
-            }}
-            QPushButton:pressed {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #3a3a3a, stop:1 #1a1a1a);
-                border-color: {primary};
-            }}
-        """)
+        """Apply themed styling to an operation button outside the control panel"""
+        btn.setStyleSheet(get_style("operation_button"))
 
 # ========================================
     # NEMA INTERFACE CREATION
@@ -1147,13 +1477,7 @@ class ServoConfigScreen(BaseScreen):
         # Left side - Configuration
         self.config_frame = QFrame()
         self.config_frame.setFrameStyle(QFrame.Shape.Box)
-        self.config_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid {theme_manager.get('primary_color')};
-                border-radius: 12px;
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        self.config_frame.setStyleSheet(get_style("nema_frame"))
         
         config_layout = QVBoxLayout()
         config_layout.setContentsMargins(20, 15, 20, 15)
@@ -1161,9 +1485,9 @@ class ServoConfigScreen(BaseScreen):
         
         # Configuration header
         self.config_header = QLabel("NEMA CONFIGURATION")
-        self.config_header.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.config_header.setFont(get_font(18, QFont.Weight.Bold))
         self.config_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.config_header.setStyleSheet(f"color: {theme_manager.get('primary_color')}; background: transparent;")
+        self.config_header.setStyleSheet(get_style("nema_header"))
         config_layout.addWidget(self.config_header)
         
         # Configuration form in grid
@@ -1266,7 +1590,7 @@ class ServoConfigScreen(BaseScreen):
         # Home button
         self.home_btn = QPushButton("🏠 HOME")
         self.home_btn.setFixedHeight(40)
-        self.home_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.home_btn.setFont(get_font(14, QFont.Weight.Bold))
         self.home_btn.clicked.connect(self.home_nema_stepper)
         self._update_operation_button_style(self.home_btn)
         control_buttons_layout.addWidget(self.home_btn)
@@ -1274,7 +1598,7 @@ class ServoConfigScreen(BaseScreen):
         # Enable/Disable toggle
         self.enable_btn = QPushButton("⚡ ENABLE")
         self.enable_btn.setFixedHeight(40)
-        self.enable_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.enable_btn.setFont(get_font(14, QFont.Weight.Bold))
         self.enable_btn.setCheckable(True)
         self.enable_btn.toggled.connect(self.on_enable_toggle)
         self._update_operation_button_style(self.enable_btn)
@@ -1294,13 +1618,7 @@ class ServoConfigScreen(BaseScreen):
         # Right side - Position Control
         self.control_frame = QFrame()
         self.control_frame.setFrameStyle(QFrame.Shape.Box)
-        self.control_frame.setStyleSheet(f"""
-            QFrame {{
-                border: 1px solid {theme_manager.get('primary_color')};
-                border-radius: 12px;
-                background-color: rgba(0, 0, 0, 0.1);
-            }}
-        """)
+        self.control_frame.setStyleSheet(get_style("nema_frame"))
         
         control_layout = QVBoxLayout()
         control_layout.setContentsMargins(20, 15, 20, 15)
@@ -1308,24 +1626,16 @@ class ServoConfigScreen(BaseScreen):
         
         # Control header
         self.control_header = QLabel("POSITION CONTROL")
-        self.control_header.setFont(QFont("Arial", 18, QFont.Weight.Bold))
+        self.control_header.setFont(get_font(18, QFont.Weight.Bold))
         self.control_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.control_header.setStyleSheet(f"color: {theme_manager.get('primary_color')}; background: transparent;")
+        self.control_header.setStyleSheet(get_style("nema_header"))
         control_layout.addWidget(self.control_header)
         
         # Current position display
         self.position_display = QLabel(f"{self.nema_config['current_position']:.1f} cm")
-        self.position_display.setFont(QFont("Arial", 36, QFont.Weight.Bold))
+        self.position_display.setFont(get_font(36, QFont.Weight.Bold))
         self.position_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.position_display.setStyleSheet(f"""
-            QLabel {{
-                color: {theme_manager.get('primary_color')};
-                border: 2px solid {theme_manager.get('primary_color')};
-                border-radius: 10px;
-                padding: 20px;
-                background-color: rgba(0, 0, 0, 0.3);
-            }}
-        """)
+        self.position_display.setStyleSheet(get_style("nema_position_display"))
         control_layout.addWidget(self.position_display)
         
         # Position slider
@@ -1360,7 +1670,7 @@ class ServoConfigScreen(BaseScreen):
 
         # Test sweep button
         self.test_sweep_btn = QPushButton("▶️ TEST SWEEP")
-        self.test_sweep_btn.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        self.test_sweep_btn.setFont(get_font(14, QFont.Weight.Bold))
         self.test_sweep_btn.setCheckable(True)
         self.test_sweep_btn.setFixedHeight(40)
         self.test_sweep_btn.clicked.connect(self.toggle_nema_test_sweep)
@@ -1381,6 +1691,17 @@ class ServoConfigScreen(BaseScreen):
         
         # Add to the grid layout at position (0,0) spanning the full width
         self.grid_layout.addWidget(container_widget, 0, 0, 1, 10)
+        
+        self.themed_spinboxes.extend([
+            self.pitch_spin, self.length_spin, self.homing_speed_spin,
+            self.normal_speed_spin, self.min_pos_spin, self.max_pos_spin
+        ])
+        self.themed_labels.extend([
+            self.config_header, pitch_label, length_label, homing_label, normal_label,
+            accel_label, self.accel_value_label, min_pos_label, max_pos_label,
+            self.nema_status_label, self.control_header, self.position_display,
+            slider_label, self.min_label, self.max_label
+        ])
 
 # ========================================
     # CONTROLLER MANAGEMENT
@@ -1429,12 +1750,33 @@ class ServoConfigScreen(BaseScreen):
 
     def clear_grid(self):
         """Clear the current grid and widget tracking"""
-        for i in reversed(range(self.grid_layout.count())):
-            widget = self.grid_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-        
-        self.servo_widgets.clear()
+        # Repaint once at the end; update_grid may already have suspended updates
+        updates_enabled = self.grid_widget.updatesEnabled()
+        self.grid_widget.setUpdatesEnabled(False)
+        try:
+            # Take non-pooled widgets (the NEMA interface) out of the layout
+            # and let Qt delete them from the event loop
+            for i in reversed(range(self.grid_layout.count())):
+                widget = self.grid_layout.itemAt(i).widget()
+                if widget and widget not in self.pooled_widgets:
+                    self.grid_layout.takeAt(i)
+                    widget.hide()
+                    widget.deleteLater()
+            
+            # Pooled channel rows are hidden, not destroyed
+            for row in self.row_pool:
+                row.set_visible(False)
+        finally:
+            self.grid_widget.setUpdatesEnabled(updates_enabled)
+        
+        self.row_channel_keys.clear()
+        self.row_sliders.clear()
+        self.row_position_labels.clear()
+        self.row_play_buttons.clear()
+        self.row_live_checkboxes.clear()
+        self.channel_to_row.clear()
+        self.themed_spinboxes.clear()
+        self.themed_labels.clear()
 
     def on_enable_toggle(self, checked):
         """Handle enable button toggle with proper UI feedback"""
@@ -1463,45 +1805,42 @@ class ServoConfigScreen(BaseScreen):
         # Send command to backend
         self.enable_nema_stepper(checked)
 
-    def check_websocket_and_detect(self):
-        """Enhanced connection monitoring with NEMA support"""
-        if not self.websocket or not self.websocket.is_connected():
-            if self.current_controller == 2:  # NEMA selected
-                if hasattr(self, 'nema_status_label'):
-                    self.nema_status_label.setText("Status: WebSocket Disconnected")
-                    self.nema_status_label.setStyleSheet("color: red; font-weight: bold; background: transparent;")
-            return
-        
-        # Original maestro detection logic for M1/M2
+    def on_websocket_connected(self):
+        """Run maestro detection once per connection, or refresh NEMA status"""
+        # A new connection may be to a restarted backend
+        self.sent_motion_settings.clear()
         if self.current_controller < 2:
             if not self.initial_detection_done:
                 self.logger.info("WebSocket connected - triggering automatic maestro detection")
                 self.detect_all_maestros()
                 self.initial_detection_done = True
-                # Stop the timer once we've done initial detection
-                self.ws_connection_timer.stop()
         else:
-            # NEMA controller - request status if needed
-            if not hasattr(self, 'last_nema_status_request'):
-                self.last_nema_status_request = 0
-            
-            import time
-            current_time = time.time()
-            if current_time - self.last_nema_status_request > 10:  # Every 10 seconds
-                self.request_nema_status()
-                self.last_nema_status_request = current_time
+            # NEMA controller - the status timer keeps polling from here
+            self.request_nema_status()
+
+    def on_websocket_disconnected(self):
+        """Show the lost connection and detect maestros again after reconnecting"""
+        self.initial_detection_done = False
+        if self.current_controller == 2 and hasattr(self, 'nema_status_label'):
+            self.nema_status_label.setText("Status: WebSocket Disconnected")
+            self.nema_status_label.setStyleSheet("color: red; font-weight: bold; background: transparent;")
 
     # ========================================
     # THEME HANDLING
     # ========================================
     
     def _on_theme_changed(self):
+        """Schedule a restyle; repeated notifications collapse into one"""
+        if not self.theme_refresh_timer.isActive():
+            self.theme_refresh_timer.start()
+
+    def _refresh_theme(self):
         """Enhanced theme change handler with NEMA support"""
+        # Restyle with painting suspended so the screen repaints once
+        self.setUpdatesEnabled(False)
         try:
-            # Update main panel styling
-            if hasattr(self, 'main_frame'):
-                self._update_control_panel_style(self.main_frame)
-
+            # One sheet on the control panel restyles the header, controller
+            # selector and operations section
             if hasattr(self, 'control_panel'):
                 self._update_control_panel_style(self.control_panel)
 
@@ -1511,41 +1850,18 @@ class ServoConfigScreen(BaseScreen):
             # Update status label
             self._update_status_label_style()
             
-            # Update header
-            if hasattr(self, 'header'):
-                self._update_header_style()
-            
-            # Update maestro section
-            if hasattr(self, 'maestro_label'):
-                self._update_maestro_label_style()
-            if hasattr(self, 'maestro1_btn'):
-                self._update_maestro_button_style(self.maestro1_btn)
-            if hasattr(self, 'maestro2_btn'):
-                self._update_maestro_button_style(self.maestro2_btn)
-            if hasattr(self, 'nema_btn'):
-                self._update_maestro_button_style(self.nema_btn)
-            
-            # Update operations section
-            if hasattr(self, 'ops_header'):
-                self._update_ops_header_style()
-            if hasattr(self, 'operation_buttons'):
-                for btn in self.operation_buttons:
-                    self._update_operation_button_style(btn)
-            if hasattr(self, 'operations_frame'):
-                self._update_operations_frame_style(self.operations_frame)
-            
-            # Update NEMA-specific elements
-            if hasattr(self, 'home_btn'):
-                self._update_operation_button_style(self.home_btn)
-            if hasattr(self, 'enable_btn'):
-                self._update_operation_button_style(self.enable_btn)
-            if hasattr(self, 'test_sweep_btn'):
-                self._update_operation_button_style(self.test_sweep_btn)
+            # Update NEMA-specific elements; they are deleted while a maestro is shown
+            if self.current_controller == 2:
+                if hasattr(self, 'home_btn'):
+                    self._update_operation_button_style(self.home_btn)
+                if hasattr(self, 'enable_btn'):
+                    self._update_operation_button_style(self.enable_btn)
+                if hasattr(self, 'test_sweep_btn'):
+                    self._update_operation_button_style(self.test_sweep_btn)
             
-            # Update scroll area if it exists
-            scroll_areas = self.findChildren(QScrollArea)
-            for scroll_area in scroll_areas:
-                self._update_scroll_area_style(scroll_area)
+            # Update the grid's scroll area
+            if hasattr(self, 'scroll_area'):
+                self._update_scroll_area_style(self.scroll_area)
             
             # Update all servo widgets in grid
             self._update_servo_widgets_theme()
@@ -1554,33 +1870,17 @@ class ServoConfigScreen(BaseScreen):
             if self.current_controller == 2:  # NEMA is active
                 # Update NEMA configuration frame borders
                 if hasattr(self, 'config_frame'):
-                    primary = theme_manager.get("primary_color")
-                    self.config_frame.setStyleSheet(f"""
-                        QFrame {{
-                            border: 1px solid {primary};
-                            border-radius: 12px;
-                            background-color: rgba(0, 0, 0, 0.1);
-                        }}
-                    """)
+                    self.config_frame.setStyleSheet(get_style("nema_frame"))
                 
                 if hasattr(self, 'control_frame'):
-                    primary = theme_manager.get("primary_color")
-                    self.control_frame.setStyleSheet(f"""
-                        QFrame {{
-                            border: 1px solid {primary};
-                            border-radius: 12px;
-                            background-color: rgba(0, 0, 0, 0.1);
-                        }}
-                    """)
+                    self.control_frame.setStyleSheet(get_style("nema_frame"))
                 
                 # Update NEMA headers
                 if hasattr(self, 'config_header'):
-                    primary = theme_manager.get("primary_color")
-                    self.config_header.setStyleSheet(f"color: {primary}; background: transparent;")
+                    self.config_header.setStyleSheet(get_style("nema_header"))
                 
                 if hasattr(self, 'control_header'):
-                    primary = theme_manager.get("primary_color")
-                    self.control_header.setStyleSheet(f"color: {primary}; background: transparent;")
+                    self.control_header.setStyleSheet(get_style("nema_header"))
                 
                 # Update all NEMA spinboxes
                 nema_spinboxes = ['pitch_spin', 'length_spin', 'homing_speed_spin', 'normal_speed_spin', 'min_pos_spin', 'max_pos_spin']
@@ -1606,102 +1906,36 @@ class ServoConfigScreen(BaseScreen):
             self.logger.info(f"Servo screen updated for theme: {theme_manager.get_theme_name()}")
         except Exception as e:
             self.logger.warning(f"Failed to apply theme changes: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _update_servo_widgets_theme(self):
         """Update theme for all servo control widgets"""
-        primary = theme_manager.get("primary_color")
+        # Pooled channel rows, including hidden ones
+        for row in self.row_pool:
+            row.apply_theme()
         
-        # Update all input widgets
-        for edit in self.findChildren(QLineEdit):
-            self._update_input_style(edit)
-        for spin in self.findChildren(QSpinBox):
+        # NEMA widgets; panel headers are styled separately and never tracked
+        for spin in self.themed_spinboxes:
             self._update_spinbox_style(spin)
-        for checkbox in self.findChildren(QCheckBox):
-            self._update_checkbox_style(checkbox)
-        for label in self.findChildren(QLabel):
-            if label not in [self.status_label, self.header, self.maestro_label, self.ops_header]:
-                label.setStyleSheet("color: white; background: transparent;")
-        
-        # Update play buttons
-        play_buttons = [widgets[2] for widgets in self.servo_widgets.values() if len(widgets) > 2]
-        for btn in play_buttons:
-            self._update_play_button_style(btn)
+        for label in self.themed_labels:
+            label.setStyleSheet("color: white; background: transparent;")
 
     def _update_input_style(self, input_field):
         """Apply themed styling to input field"""
-        primary = theme_manager.get("primary_color")
-        input_field.setStyleSheet(f"""
-        QLineEdit {{
-            background-color: #2d2d2d;
-            border: 1px solid #555;
-            border-radius: 4px;
-            padding: 6px;
-            color: white;
-        }}
-        QLineEdit:focus {{ 
-            border-color: {primary}; 
-            background-color: #333333;
-        }}
-        """)
+        input_field.setStyleSheet(get_style("input"))
 
     def _update_spinbox_style(self, spinbox):
         """Apply themed styling to spinbox"""
-        primary = theme_manager.get("primary_color")
-        spinbox.setStyleSheet(f"""
-        QSpinBox {{
-            background-color: #2d2d2d;
-            border: 1px solid #555;
-            border-radius: 4px;
-            padding: 6px;
-            color: white;
-        }}
-        QSpinBox:focus {{ 
-            border-color: {primary}; 
-            background-color: #333333;
-        }}
-        """)
+        spinbox.setStyleSheet(get_style("spinbox"))
 
     def _update_checkbox_style(self, checkbox):
         """Apply themed styling to checkbox"""
-        green = theme_manager.get("green")
-        checkbox.setStyleSheet(f"""
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-            }}
-            QCheckBox::indicator:unchecked {{
-                background-color: #333;
-                border: 1px solid #666;
-                border-radius: 2px;
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {green};
-                border: 1px solid {green};
-                border-radius: 2px;
-            }}
-        """)
+        checkbox.setStyleSheet(get_style("checkbox"))
 
     def _update_play_button_style(self, btn):
         """Apply themed styling to play button"""
-        red = theme_manager.get("red")
-        btn.setStyleSheet(f"""
-            QPushButton {{
-                border: none;
-                background-color: #444;
-                color: white;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #555;
-            }}
-            QPushButton:pressed {{
-                background-color: #333;
-            }}
-            QPushButton:checked {{
-                background-color: {red};
-                color: white;
-            }}
-        """)
+        btn.setStyleSheet(get_style("play_button"))
 
 # ========================================
     # MAESTRO GRID AND CONTROL METHODS
@@ -1760,10 +1994,8 @@ class ServoConfigScreen(BaseScreen):
         self.update_status(f"Detecting Maestro {maestro_num} controller...")
         
         if not self.websocket or not self.websocket.is_connected():
+            # Detection reruns from on_websocket_connected once the connection is back
             self.update_status("Cannot detect maestro: WebSocket not connected", error=True)
-            # Restart the connection monitoring timer
-            if not self.ws_connection_timer.isActive():
-                self.ws_connection_timer.start(2000)
             return
         
         success = self.send_websocket_message("get_maestro_info", maestro=maestro_num)
@@ -1785,6 +2017,7 @@ class ServoConfigScreen(BaseScreen):
         maestro_num = self.current_maestro + 1
         self.maestro_connected[maestro_num] = False
         self.maestro_channel_counts[maestro_num] = 0
+        self.sent_motion_settings.clear()
         
         # Clear the grid immediately
         self.clear_grid()
@@ -1803,24 +2036,53 @@ class ServoConfigScreen(BaseScreen):
         """Handle incoming WebSocket messages - calls the enhanced handler"""
         self.handle_message(message)
 
+    def queue_position_update(self, channel_key: str, position: int):
+        """Queue a position for display, waking the UI only for the first queued update"""
+        self.position_queue.append((channel_key, position))
+        if len(self.position_queue) == 1:
+            self.positions_queued_signal.emit()
+
+    def drain_position_queue(self):
+        """Apply every queued position update"""
+        queue = self.position_queue
+        if len(queue) == 1:
+            channel_key, position = queue.popleft()
+            self.update_servo_position_display(channel_key, position)
+            return
+        
+        # Only the newest queued position per channel is worth showing
+        latest = dict(queue)
+        queue.clear()
+        
+        # A bulk read touches every row; repaint the grid once rather than per slider
+        self.grid_widget.setUpdatesEnabled(False)
+        try:
+            for channel_key, position in latest.items():
+                self.update_servo_position_display(channel_key, position)
+        finally:
+            self.grid_widget.setUpdatesEnabled(True)
+
     def update_servo_position_display(self, channel_key: str, position: int):
         """Thread-safe method to update servo position display"""
-        if channel_key in self.servo_widgets:
-            widgets = self.servo_widgets[channel_key]
-            slider = widgets[0]
-            pos_label = widgets[1]
+        row = self.channel_to_row.get(channel_key)
+        if row is not None:
+            slider = self.row_sliders[row]
+            pos_label = self.row_position_labels[row]
             
-            # Update slider position without triggering servo movement
-            slider.blockSignals(True)
-            slider.setValue(position)
-            slider.blockSignals(False)
+            # Update slider position without triggering servo movement; idle
+            # servos re-report the same value, so skip writes that change nothing
+            if slider.value() != position:
+                with QSignalBlocker(slider):
+                    slider.setValue(position)
             
             # Update position label with theme color
-            green = theme_manager.get("green")
-            pos_label.setText(f"V: {position}")
-            pos_label.setStyleSheet(f"color: {green}; background: transparent;")
+            text = f"V: {position}"
+            if pos_label.text() != text:
+                pos_label.setText(text)
+            set_style_if_changed(pos_label, get_style("readout_green"))
             
-            self.logger.debug(f"Updated display: {channel_key} = {position}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Updated display: {channel_key} = {position}")
 
     def check_detection_timeout(self):
         """Check if detection timed out and retry if needed"""
@@ -1835,14 +2097,11 @@ class ServoConfigScreen(BaseScreen):
         self.status_label.setText(message)
         
         if error:
-            red = theme_manager.get("red")
-            self.status_label.setStyleSheet(f"color: {red}; padding: 3px;")
+            set_style_if_changed(self.status_label, get_style("status_error"))
         elif warning:
-            primary = theme_manager.get("primary_color")
-            self.status_label.setStyleSheet(f"color: {primary}; padding: 3px;")
+            set_style_if_changed(self.status_label, get_style("status_label"))
         else:
-            green = theme_manager.get("green")
-            self.status_label.setStyleSheet(f"color: {green}; padding: 3px;")
+            set_style_if_changed(self.status_label, get_style("status_ok"))
         
         self.logger.info(f"Status: {message}")
     
@@ -1871,127 +2130,35 @@ class ServoConfigScreen(BaseScreen):
         if hasattr(self, 'position_update_timer_auto') and self.position_update_timer_auto.isActive():
             self.position_update_timer_auto.stop()
         
-        self.clear_grid()
-        
-        font = QFont("Arial", 14)
-        
-        # Create grid for detected channels
-        for i in range(channel_count):
-            channel_key = f"m{maestro_num}_ch{i}"
-            config = self.servo_config.get(channel_key, {})
-            row = i
-            
-            # Channel number
-            label = QLabel(f"Ch{i}")
-            label.setFont(font)
-            label.setFixedWidth(35)
-            label.setStyleSheet("color: white; background: transparent;")
-            self.grid_layout.addWidget(label, row, 0)
-            
-            # Name edit
-            name_edit = QLineEdit(config.get("name", ""))
-            name_edit.setFont(QFont("Arial", 16))
-            name_edit.setMaxLength(25)
-            name_edit.setFixedWidth(140)
-            name_edit.setPlaceholderText("Servo Name")
-            name_edit.textChanged.connect(lambda text, k=channel_key: self.update_config(k, "name", text))
-            self._update_input_style(name_edit)
-            self.grid_layout.addWidget(name_edit, row, 1)
-            
-            # Slider for position control with custom styling and home indicator
-            slider = HomePositionSlider(Qt.Orientation.Horizontal)
-            min_val = config.get("min", 992)
-            max_val = config.get("max", 2000)
-            home_pos = config.get("home")
-            slider.setMinimum(min_val)
-            slider.setMaximum(max_val)
-            slider.setValue((min_val + max_val) // 2)
-            slider.setFixedWidth(140)
-            slider.setMinimumHeight(24)
-            
-            # Set home position indicator if available
-            if home_pos is not None:
-                slider.set_home_position(home_pos)
-            self.grid_layout.addWidget(slider, row, 2)
-            
-            # Min/Max value controls
-            min_spin = QSpinBox()
-            min_spin.setFont(QFont("Arial", 16))
-            min_spin.setRange(0, 2500)
-            min_spin.setValue(min_val)
-            min_spin.setFixedWidth(75)
-            min_spin.valueChanged.connect(lambda val, k=channel_key: self.update_config(k, "min", val))
-            min_spin.valueChanged.connect(lambda val, s=slider: s.setMinimum(val))
-            self._update_spinbox_style(min_spin)
-            self.grid_layout.addWidget(min_spin, row, 3)
-            
-            max_spin = QSpinBox()
-            max_spin.setFont(QFont("Arial", 16))
-            max_spin.setRange(0, 2500)
-            max_spin.setValue(max_val)
-            max_spin.setFixedWidth(75)
-            max_spin.valueChanged.connect(lambda val, k=channel_key: self.update_config(k, "max", val))
-            max_spin.valueChanged.connect(lambda val, s=slider: s.setMaximum(val))
-            self._update_spinbox_style(max_spin)
-            self.grid_layout.addWidget(max_spin, row, 4)
-            
-            # Speed/Acceleration controls
-            speed_spin = QSpinBox()
-            speed_spin.setFont(QFont("Arial", 16))
-            speed_spin.setRange(0, 100)
-            speed_spin.setValue(config.get("speed", 0))
-            speed_spin.setFixedWidth(60)
-            speed_spin.valueChanged.connect(lambda val, k=channel_key: self.update_servo_speed_config(k, val))
-            self._update_spinbox_style(speed_spin)
-            self.grid_layout.addWidget(speed_spin, row, 5)
-            
-            accel_spin = QSpinBox()
-            accel_spin.setFont(QFont("Arial", 16))
-            accel_spin.setRange(0, 100)
-            accel_spin.setValue(config.get("accel", 0))
-            accel_spin.setFixedWidth(60)
-            accel_spin.valueChanged.connect(lambda val, k=channel_key: self.update_servo_accel_config(k, val))
-            self._update_spinbox_style(accel_spin)
-            self.grid_layout.addWidget(accel_spin, row, 6)
-            
-            # Position label
-            pos_label = QLabel("---")
-            pos_label.setFont(QFont("Arial", 16))
-            pos_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            pos_label.setFixedWidth(60)
-            primary = theme_manager.get("primary_color")
-            pos_label.setStyleSheet(f"color: {primary}; background: transparent;")
-            self.grid_layout.addWidget(pos_label, row, 7)
-            
-            # Live update checkbox
-            live_checkbox = QCheckBox()
-            live_checkbox.setChecked(False)
-            live_checkbox.setToolTip("Enable live servo updates")
-            live_checkbox.setFixedSize(20, 20)
-            self._update_checkbox_style(live_checkbox)
-            self.grid_layout.addWidget(live_checkbox, row, 8)
-            
-            # Play/sweep button with themed styling
-            play_btn = QPushButton("▶️")
-            play_btn.setFont(QFont("Arial", 12))
-            play_btn.setCheckable(True)
-            play_btn.setFixedSize(30, 30)
-            self._update_play_button_style(play_btn)
-            play_btn.clicked.connect(
-                lambda checked, k=channel_key, p=pos_label, b=play_btn,
-                min_spin=min_spin, max_spin=max_spin, speed_spin=speed_spin:
-                self.toggle_sweep_minmax(k, p, b, min_spin.value(), max_spin.value(), speed_spin.value())
-            )
-            self.grid_layout.addWidget(play_btn, row, 9)
-            
-            # Connect slider to servo movement
-            slider.valueChanged.connect(
-                lambda val, k=channel_key, p=pos_label, cb=live_checkbox:
-                self.update_servo_position_conditionally(k, p, val, cb)
-            )
+        # Rebuild with painting suspended so the grid repaints once; rows
+        # bind their values under signal blockers
+        self.grid_widget.setUpdatesEnabled(False)
+        try:
+            self.clear_grid()
             
-            # Track widgets for position updates
-            self.servo_widgets[channel_key] = (slider, pos_label, play_btn, live_checkbox, name_edit)
+            # Grow the row pool to the largest channel count seen so far
+            while len(self.row_pool) < channel_count:
+                row = ServoChannelRow(self, len(self.row_pool))
+                self.row_pool.append(row)
+                self.pooled_widgets.update(row.widgets)
+            
+            # Rebind a pooled row for each detected channel
+            channel_config = self.servo_config.get
+            for i in range(channel_count):
+                channel_key = f"m{maestro_num}_ch{i}"
+                row = self.row_pool[i]
+                row.bind(channel_key, i, channel_config(channel_key, EMPTY_CHANNEL_CONFIG))
+                row.set_visible(True)
+                
+                # Track widgets for position updates
+                self.channel_to_row[channel_key] = i
+                self.row_channel_keys.append(channel_key)
+                self.row_sliders.append(row.slider)
+                self.row_position_labels.append(row.pos_label)
+                self.row_play_buttons.append(row.play_btn)
+                self.row_live_checkboxes.append(row.live_checkbox)
+        finally:
+            self.grid_widget.setUpdatesEnabled(True)
         
         self.update_status(f"Maestro {maestro_num}: {channel_count} channels loaded")
 
@@ -2000,9 +2167,10 @@ class ServoConfigScreen(BaseScreen):
         if channel_key not in self.servo_config:
             self.servo_config[channel_key] = {}
         self.servo_config[channel_key]["speed"] = speed
-        self.save_config()
+        self.schedule_config_save()
         
         # Send to backend immediately
+        self.sent_motion_settings.pop(channel_key, None)
         self.send_websocket_message("servo_speed", channel=channel_key, speed=speed)
 
     def update_servo_accel_config(self, channel_key: str, accel: int):
@@ -2010,9 +2178,10 @@ class ServoConfigScreen(BaseScreen):
         if channel_key not in self.servo_config:
             self.servo_config[channel_key] = {}
         self.servo_config[channel_key]["accel"] = accel
-        self.save_config()
+        self.schedule_config_save()
         
         # Send to backend immediately
+        self.sent_motion_settings.pop(channel_key, None)
         self.send_websocket_message("servo_acceleration", channel=channel_key, acceleration=accel)
 
 # ========================================
@@ -2021,14 +2190,25 @@ class ServoConfigScreen(BaseScreen):
     
     def update_all_positions(self):
         """Update all servo positions for current Maestro"""
+        # A read already in flight will deliver fresh positions
+        if self.reading_positions:
+            return
+        
         maestro_num = self.current_maestro + 1
         
-        if not self.maestro_connected.get(maestro_num, False) or not self.servo_widgets:
+        if not self.maestro_connected.get(maestro_num, False) or not self.row_sliders:
             return
         
+        # Mark the read in flight so a manual read can't send a duplicate request
+        self.reading_positions = True
+        self.position_read_timeout.start(3000)
+        
         success = self.send_websocket_message("get_all_servo_positions", maestro=maestro_num)
         if success:
             self.logger.debug(f"Auto-updating positions for Maestro {maestro_num}")
+        else:
+            self.reading_positions = False
+            self.position_read_timeout.stop()
     
     def read_all_positions_now(self):
         """Manually read all servo positions for current Maestro"""
@@ -2063,19 +2243,14 @@ class ServoConfigScreen(BaseScreen):
         self.update_status(f"Maestro {maestro_num} not responding - check connection", error=True)
         
         # Set all sliders to center position as fallback
-        primary = theme_manager.get("primary_color")
-        for channel_key, widgets in self.servo_widgets.items():
-            if channel_key.startswith(f"m{maestro_num}_"):
-                slider = widgets[0]
-                pos_label = widgets[1]
-                
-                center = (slider.minimum() + slider.maximum()) // 2
-                slider.blockSignals(True)
-                slider.setValue(center)
-                slider.blockSignals(False)
-                
-                pos_label.setText(f"V: {center}")
-                pos_label.setStyleSheet(f"color: {primary}; background: transparent;")
+        for slider, pos_label in zip(self.row_sliders, self.row_position_labels):
+            center = (slider.minimum() + slider.maximum()) // 2
+            slider.blockSignals(True)
+            slider.setValue(center)
+            slider.blockSignals(False)
+            
+            pos_label.setText(f"V: {center}")
+            set_style_if_changed(pos_label, get_style("readout_primary"))
     
     def update_servo_position_conditionally(self, channel_key: str, pos_label: QLabel, 
                                            value: int, live_checkbox: QCheckBox):
@@ -2083,11 +2258,20 @@ class ServoConfigScreen(BaseScreen):
         pos_label.setText(f"V: {value}")
         
         if live_checkbox.isChecked():
-            self.update_servo_position(channel_key, pos_label, value)
-            red = theme_manager.get("red")
-            pos_label.setStyleSheet(f"color: {red}; background: transparent;")
+            # Drags fire on every pixel; keep only the latest value until the timer fires
+            self.pending_servo_moves[channel_key] = (pos_label, value)
+            if not self.servo_move_timer.isActive():
+                self.servo_move_timer.start()
+            set_style_if_changed(pos_label, get_style("readout_red"))
         else:
-            pos_label.setStyleSheet("color: #AAAAAA; background: transparent;")
+            set_style_if_changed(pos_label, "color: #AAAAAA; background: transparent;")
+    
+    def flush_servo_moves(self):
+        """Send the latest pending live slider value for each dragged channel"""
+        pending = self.pending_servo_moves
+        self.pending_servo_moves = {}
+        for channel_key, (pos_label, value) in pending.items():
+            self.update_servo_position(channel_key, pos_label, value)
     
     def update_servo_position(self, channel_key: str, pos_label: QLabel, value: int):
         """Send servo position command with configuration"""
@@ -2096,13 +2280,23 @@ class ServoConfigScreen(BaseScreen):
         accel = config.get("accel", 0)
         
         # Apply speed and acceleration settings
-        self.send_websocket_message("servo_speed", channel=channel_key, speed=speed)
-        self.send_websocket_message("servo_acceleration", channel=channel_key, acceleration=accel)
+        self.send_motion_settings(channel_key, speed, accel)
         
         # Send position command
         self.send_websocket_message("servo", channel=channel_key, pos=value)
         
-        self.logger.debug(f"Servo command: {channel_key} -> {value} (speed: {speed}, accel: {accel})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Servo command: {channel_key} -> {value} (speed: {speed}, accel: {accel})")
+    
+    def send_motion_settings(self, channel_key: str, speed: int, accel: int):
+        """Send a channel's speed and acceleration unless the backend already has them"""
+        settings = (speed, accel)
+        if self.sent_motion_settings.get(channel_key) == settings:
+            return
+        speed_sent = self.send_websocket_message("servo_speed", channel=channel_key, speed=speed)
+        accel_sent = self.send_websocket_message("servo_acceleration", channel=channel_key, acceleration=accel)
+        if speed_sent and accel_sent:
+            self.sent_motion_settings[channel_key] = settings
         
     def set_home_positions(self):
         """Set current slider positions as home positions for all servos"""
@@ -2116,21 +2310,20 @@ class ServoConfigScreen(BaseScreen):
         home_count = 0
         home_positions = {}
         
-        for channel_key, widgets in self.servo_widgets.items():
-            if channel_key.startswith(f"m{maestro_num}_"):
-                slider = widgets[0]  # Get slider widget
-                current_pos = slider.value()  # Get current slider position
-                
-                # Update visual indicator
-                slider.set_home_position(current_pos)
-                if channel_key not in self.servo_config:
-                    self.servo_config[channel_key] = {}
-                self.servo_config[channel_key]["home"] = current_pos
-                # Prepare for backend
-                channel_num = int(channel_key.split("_ch")[1])
-                home_positions[channel_num] = current_pos
-                
-                home_count += 1
+        # The row lists only ever hold the shown maestro's channels; row index = channel
+        rows = zip(self.row_channel_keys, self.row_sliders)
+        for channel_num, (channel_key, slider) in enumerate(rows):
+            current_pos = slider.value()  # Get current slider position
+            
+            # Update visual indicator
+            slider.set_home_position(current_pos)
+            if channel_key not in self.servo_config:
+                self.servo_config[channel_key] = {}
+            self.servo_config[channel_key]["home"] = current_pos
+            # Prepare for backend
+            home_positions[channel_num] = current_pos
+            
+            home_count += 1
         
         # Save and notify
         success = config_manager.save_config("resources/configs/servo_config.json", self.servo_config)
@@ -2148,36 +2341,33 @@ class ServoConfigScreen(BaseScreen):
             self.update_status(f"Maestro {maestro_num} not connected", error=True)
             return
         
-        home_count = 0
-        for channel_key in self.servo_widgets.keys():
-            if channel_key.startswith(f"m{maestro_num}_"):
-                config = self.servo_config.get(channel_key, {})
-                home_pos = config.get("home")
+        # Collected while walking the shown maestro's rows (row index = channel)
+        # rather than prefix-scanning the whole config afterwards
+        home_positions = {}
+        rows = zip(self.row_channel_keys, self.row_sliders, self.row_position_labels)
+        for channel_num, (channel_key, slider, pos_label) in enumerate(rows):
+            config = self.servo_config.get(channel_key, {})
+            home_pos = config.get("home")
+            
+            if home_pos is not None:
+                # Apply configured speed and acceleration first
+                speed = config.get("speed", 0)
+                accel = config.get("accel", 0)
+
+                self.send_motion_settings(channel_key, speed, accel)
+                self.send_websocket_message("servo", channel=channel_key, pos=home_pos)
                 
-                if home_pos is not None:
-                    # Apply configured speed and acceleration first
-                    speed = config.get("speed", 0)
-                    accel = config.get("accel", 0)
-
-                    self.send_websocket_message("servo_speed", channel=channel_key, speed=speed)
-                    self.send_websocket_message("servo_acceleration", channel=channel_key, acceleration=accel)
-                    self.send_websocket_message("servo", channel=channel_key, pos=home_pos)
-                    
-                    # Update slider to home position
-                    widgets = self.servo_widgets[channel_key]
-                    slider = widgets[0]
-                    pos_label = widgets[1]
-                    
-                    slider.blockSignals(True)
-                    slider.setValue(home_pos)
-                    slider.blockSignals(False)
-                    
-                    pos_label.setText(f"H: {home_pos}")
-                    primary = theme_manager.get("primary_color")  # Gold equivalent for home
-                    pos_label.setStyleSheet(f"color: {primary}; background: transparent;")
-                    
-                    home_count += 1
+                # Update slider to home position
+                slider.blockSignals(True)
+                slider.setValue(home_pos)
+                slider.blockSignals(False)
+                
+                pos_label.setText(f"H: {home_pos}")
+                set_style_if_changed(pos_label, get_style("readout_primary"))
+                
+                home_positions[channel_num] = home_pos
         
+        home_count = len(home_positions)
         if home_count > 0:
             self.update_status(f"Moving {home_count} servos to home positions")
             self.logger.info(f"Sent {home_count} servos to home positions")
@@ -2185,19 +2375,10 @@ class ServoConfigScreen(BaseScreen):
             # Send home positions to backend
             self.send_websocket_message("servo_home_positions", 
                                        maestro=maestro_num, 
-                                       home_positions=self.get_maestro_home_positions(maestro_num))
+                                       home_positions=home_positions)
         else:
             self.update_status("No home positions set", warning=True)
     
-    def get_maestro_home_positions(self, maestro_num: int) -> dict:
-        """Get home positions for specific maestro"""
-        home_positions = {}
-        for channel_key, config in self.servo_config.items():
-            if channel_key.startswith(f"m{maestro_num}_") and "home" in config:
-                channel = int(channel_key.split("_ch")[1])
-                home_positions[channel] = config["home"]
-        return home_positions
-    
     def toggle_sweep_minmax(self, channel_key: str, pos_label: QLabel, button: QPushButton, 
                            min_val: int, max_val: int, speed: int):
         """Toggle min/max sweep for a servo channel"""
@@ -2226,12 +2407,11 @@ class ServoConfigScreen(BaseScreen):
     
     def toggle_all_live_checkboxes(self):
         """Toggle all live update checkboxes"""
-        any_checked = any(widgets[3].isChecked() for widgets in self.servo_widgets.values() if len(widgets) > 3)
+        any_checked = any(checkbox.isChecked() for checkbox in self.row_live_checkboxes)
         
         new_state = not any_checked
-        for widgets in self.servo_widgets.values():
-            if len(widgets) > 3:
-                widgets[3].setChecked(new_state)
+        for checkbox in self.row_live_checkboxes:
+            checkbox.setChecked(new_state)
         
         status = "enabled" if new_state else "disabled"
         self.update_status(f"All live updates {status}")
@@ -2258,8 +2438,19 @@ class ServoConfigScreen(BaseScreen):
         
 
     @error_boundary
+    def schedule_config_save(self):
+        """Save the servo configuration once the current burst of edits settles"""
+        if not self.config_save_timer.isActive():
+            self.config_save_timer.start()
+
+    def flush_config_save(self):
+        """Write a pending scheduled save immediately"""
+        if self.config_save_timer.isActive():
+            self.save_config()
+
     def save_config(self):
         """Save servo configuration to file"""
+        self.config_save_timer.stop()
         success = config_manager.save_config("resources/configs/servo_config.json", self.servo_config)
         if success:
             self.logger.info("Servo configuration saved")
@@ -2278,26 +2469,12 @@ class ServoConfigScreen(BaseScreen):
             self.update_grid()
         self.logger.info("Servo config reloaded")
 
-    def update_config(self, config_dict: Dict[str, Any]) -> bool:
-        try:
-            # Don't allow updates while moving
-            if self.state == MotorState.MOVING:
-                logger.warning("Cannot update config while motor is moving")
-                return False
-            
-            old_config = dict(self.config.__dict__)  # Save old config
-            self.config.update_from_dict(config_dict)
-            
-            # Log what actually changed
-            for key, value in config_dict.items():
-                if hasattr(self.config, key):
-                    logger.info(f"NEMA config updated: {key} = {value}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to update NEMA config: {e}")
-            return False
+    def update_config(self, channel_key: str, key: str, value):
+        """Update one setting of a servo channel and schedule a save"""
+        if channel_key not in self.servo_config:
+            self.servo_config[channel_key] = {}
+        self.servo_config[channel_key][key] = value
+        self.schedule_config_save()
 
     # ========================================
     # CLEANUP METHODS
@@ -2323,9 +2500,16 @@ class ServoConfigScreen(BaseScreen):
         # Stop all operations
         self.stop_all_operations()
         
-        # Stop the WebSocket monitoring timer
-        if hasattr(self, 'ws_connection_timer'):
-            self.ws_connection_timer.stop()
+        # Don't lose channel edits still waiting for the debounced save
+        self.flush_config_save()
+        
+        # Stop following the WebSocket's connection state
+        if self.websocket:
+            try:
+                self.websocket.connected.disconnect(self.on_websocket_connected)
+                self.websocket.disconnected.disconnect(self.on_websocket_disconnected)
+            except TypeError:
+                pass
         
         self.logger.info("Servo screen cleanup completed")
 
@@ -2346,15 +2530,24 @@ class MinMaxSweep:
         
         # State tracking
         self.current_target = None
+        self.last_position = None  # Last position shown, so repeated reports are skipped
         self.going_to_max = True
         self.position_tolerance = 1
         self.check_interval = 100
+        self.reply_timeout = 1000
         self.hold_delay = 1000
         
-        # Timers
+        # Timers; the next position request is scheduled when a reply arrives,
+        # so requests never pile up behind a slow backend
         self.check_timer = QTimer()
+        self.check_timer.setSingleShot(True)
         self.check_timer.timeout.connect(self.check_position)
         
+        # Safety net: ask again if a request goes unanswered
+        self.reply_timer = QTimer()
+        self.reply_timer.setSingleShot(True)
+        self.reply_timer.timeout.connect(self.check_position)
+        
         self.hold_timer = QTimer()
         self.hold_timer.setSingleShot(True)
         self.hold_timer.timeout.connect(self.continue_after_hold)
@@ -2364,15 +2557,10 @@ class MinMaxSweep:
     
     def start_sweep(self):
         """Start the sweep by configuring servo and moving to first target"""
-        # Apply speed setting
-        if self.speed >= 0:
-            self.parent_screen.send_websocket_message("servo_speed", channel=self.channel_key, speed=self.speed)
-        
-        # Apply acceleration from config
+        # Apply speed setting and acceleration from config
         config = self.parent_screen.servo_config.get(self.channel_key, {})
         accel = config.get("accel", 0)
-        if accel >= 0:
-            self.parent_screen.send_websocket_message("servo_acceleration", channel=self.channel_key, acceleration=accel)
+        self.parent_screen.send_motion_settings(self.channel_key, self.speed, accel)
         
         # Move to first target (max)
         self.move_to_next_target()
@@ -2394,25 +2582,32 @@ class MinMaxSweep:
         
         # Update UI with theme color
         self.label.setText(f"->{self.current_target}")
-        primary = theme_manager.get("primary_color")
-        self.label.setStyleSheet(f"color: {primary}; background: transparent;")
+        set_style_if_changed(self.label, get_style("readout_primary"))
     
     def check_position(self):
         """Request current position for sweep validation"""
         self.parent_screen.send_websocket_message("get_servo_position", channel=self.channel_key)
+        self.reply_timer.start(self.reply_timeout)
     
     def position_reached(self, actual_position: int):
         """Called when position update received"""
         if self.current_target is None:
             return
         
+        self.reply_timer.stop()
+        repeated = actual_position == self.last_position
+        self.last_position = actual_position
+        
         if actual_position == self.current_target:
+            # Already holding at this target; an echo must not restart the hold
+            if self.hold_timer.isActive():
+                return
+            
             self.logger.debug(f"{self.channel_key} reached {self.current_target} precisely")
             
             # Update UI to show reached
             self.label.setText(f"@{actual_position}")
-            green = theme_manager.get("green")
-            self.label.setStyleSheet(f"color: {green}; background: transparent;")
+            set_style_if_changed(self.label, get_style("readout_green"))
             
             # Stop position checking during hold delay
             self.check_timer.stop()
@@ -2422,10 +2617,15 @@ class MinMaxSweep:
             
         else:
             # Still moving, update display
-            self.label.setText(f"V:{actual_position}")
-            primary_light = theme_manager.get("primary_light")
-            self.label.setStyleSheet(f"color: {primary_light}; background: transparent;")
-            self.logger.debug(f"{self.channel_key}: {actual_position}/{self.current_target}")
+            if not repeated:
+                self.label.setText(f"V:{actual_position}")
+                set_style_if_changed(self.label, get_style("readout_primary_light"))
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"{self.channel_key}: {actual_position}/{self.current_target}")
+            
+            # Poll again only now that this reply is in
+            if not self.hold_timer.isActive() and not self.check_timer.isActive():
+                self.check_timer.start(self.check_interval)
     
     def continue_after_hold(self):
         """Continue sweep after hold delay"""
@@ -2441,6 +2641,7 @@ class MinMaxSweep:
     def stop(self):
         """Stop the sweep and return to center"""
         self.check_timer.stop()
+        self.reply_timer.stop()
         self.hold_timer.stop()
         
         # Return to center position